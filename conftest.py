@@ -0,0 +1,108 @@
+"""
+Shared pytest fixtures for the SPECTRE MCP test scripts
+"""
+
+import collections
+from typing import Any, Dict
+
+import pytest
+
+from server.events import EventBroadcaster
+
+# JSON-RPC 2.0 response envelope: exactly one of result/error
+ENVELOPE_SCHEMA = {
+    "type": "object",
+    "required": ["jsonrpc", "id"],
+    "properties": {
+        "jsonrpc": {"const": "2.0"},
+        "id": {"type": ["integer", "string", "null"]},
+        "result": {},
+        "error": {"type": "object", "required": ["code", "message"]}
+    },
+    "oneOf": [{"required": ["result"]}, {"required": ["error"]}]
+}
+
+
+def _validate_envelope(response):
+    """Check a response against ENVELOPE_SCHEMA without fastjsonschema."""
+    if not isinstance(response, dict):
+        raise ValueError("data must be object")
+    for field in ENVELOPE_SCHEMA["required"]:
+        if field not in response:
+            raise ValueError(f"data must contain ['{field}'] properties")
+    if response["jsonrpc"] != "2.0":
+        raise ValueError("data.jsonrpc must be same as const definition: 2.0")
+    request_id = response["id"]
+    is_integer = isinstance(request_id, int) or (isinstance(request_id, float) and request_id.is_integer())
+    if request_id is not None and not isinstance(request_id, str) and (isinstance(request_id, bool) or not is_integer):
+        raise ValueError("data.id must be integer or string or null")
+    if "error" in response:
+        error = response["error"]
+        if not isinstance(error, dict) or "code" not in error or "message" not in error:
+            raise ValueError("data.error must be object with ['code', 'message'] properties")
+    if ("result" in response) == ("error" in response):
+        raise ValueError("data must be valid exactly by one definition")
+    return response
+
+
+class FakeBroadcaster(EventBroadcaster):
+    """
+    EventBroadcaster that collects events in a deque.
+
+    The tests are single-threaded and nothing drains the events, so the
+    lock and queue.Queue of the real broadcaster are not needed.
+    """
+
+    def __init__(self):
+        self.events = collections.deque()
+        self.event_counter = 0
+
+    def emit(self, event_type: str, data: Dict[str, Any]):
+        """
+        Record an event instead of queueing it for WebSocket clients.
+
+        Args:
+            event_type: Type of event
+            data: Event data dictionary
+        """
+        self.event_counter += 1
+        self.events.append({
+            "id": self.event_counter,
+            "type": event_type,
+            "timestamp": self._get_current_timestamp(),
+            "data": data
+        })
+
+
+@pytest.fixture(scope="session")
+def broadcaster():
+    """Event broadcaster shared by every test in the session"""
+    return FakeBroadcaster()
+
+
+@pytest.fixture(scope="session")
+def handler(broadcaster):
+    """MCP handler shared by every test in the session"""
+    # Imported here so collection and deselected runs skip numpy and the
+    # world engine
+    from server.mcp_handler import MCPHandler
+    from server.world_engine import WorldEngine
+    from server.database import DatabaseManager
+
+    return MCPHandler(WorldEngine(), broadcaster, DatabaseManager())
+
+
+@pytest.fixture(scope="session")
+def validate_envelope():
+    """
+    JSON-RPC envelope validator, compiled once per session.
+
+    Raises ValueError (fastjsonschema's JsonSchemaException is a subclass)
+    when a response is not a valid JSON-RPC 2.0 response.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return _validate_envelope
+
+    return fastjsonschema.compile(ENVELOPE_SCHEMA)
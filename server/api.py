@@ -4,7 +4,7 @@ SPECTRE World Generation - REST API Module
 Provides HTTP endpoints for web UI interaction.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 import sys
@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(__file__))
 
 from world_engine import WorldEngine
 from database import DatabaseManager
+from serialization import dumps
 
 # Create router
 router = APIRouter(prefix="/api", tags=["api"])
@@ -87,10 +88,11 @@ async def get_world(world_id: str):
         if not world_data:
             raise HTTPException(status_code=404, detail="World not found")
 
-        return {
-            "status": "success",
-            "world": world_data
-        }
+        # Serialize directly so numpy grids skip FastAPI's generic encoder
+        return Response(
+            content=dumps({"status": "success", "world": world_data}),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -155,12 +157,15 @@ async def describe_region(request: RegionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/worlds/{world_id}/pois")
-async def list_pois(world_id: str):
+async def list_pois(world_id: str, offset: int = 0, limit: Optional[int] = None):
     """
-    List all points of interest in a world.
+    List points of interest in a world, optionally one page at a time.
     """
     try:
-        pois = engine.list_pois(world_id)
+        if limit is None:
+            pois = engine.list_pois(world_id)
+        else:
+            pois = engine.list_pois_page(world_id, offset, limit)
 
         return {
             "status": "success",
@@ -322,8 +327,7 @@ async def delete_world(world_id: str):
         await database.delete_world(world_id)
 
         # Remove from memory
-        if world_id in engine.worlds:
-            del engine.worlds[world_id]
+        engine.delete_world(world_id)
 
         return {
             "status": "success",
@@ -345,11 +349,17 @@ async def health_check():
     }
 
 # Add router to main app (this will be called from main.py)
-def add_router(app):
+def add_router(app, db: Optional[DatabaseManager] = None):
     """
     Add API router to FastAPI app.
 
     Args:
         app: FastAPI application instance
+        db: Optional shared DatabaseManager, so the REST endpoints reuse the
+            server's long-lived connection instead of their own
     """
+    global database
+    if db is not None:
+        database = db
+
     app.include_router(router)
\ No newline at end of file
@@ -5,28 +5,202 @@ Handles SQLite database persistence for world data.
 """
 
 import aiosqlite
+import asyncio
 import json
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from urllib.parse import quote
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+from serialization import dumps, dump
+
+# Number of read-only connections kept open alongside the writer
+READ_POOL_SIZE = 3
+
+# Serialized form of an empty dict, reused instead of re-encoding it
+_EMPTY_JSON = "{}"
+
+# SQL statements, defined once and reused by DatabaseManager
+_INSERT_WORLD_SQL = """
+INSERT OR REPLACE INTO worlds (id, data, created_at, updated_at)
+VALUES (?, ?, ?, ?)
+"""
+_SELECT_WORLD_SQL = "SELECT data FROM worlds WHERE id = ?"
+_SELECT_WORLD_IDS_SQL = "SELECT id FROM worlds"
+_DELETE_EVENTS_SQL = "DELETE FROM events WHERE world_id = ?"
+_DELETE_POIS_SQL = "DELETE FROM pois WHERE world_id = ?"
+_DELETE_LORE_SQL = "DELETE FROM lore WHERE world_id = ?"
+_DELETE_TIMELINE_SQL = "DELETE FROM timeline WHERE world_id = ?"
+_DELETE_WORLD_SQL = "DELETE FROM worlds WHERE id = ?"
+_INSERT_EVENT_SQL = """
+INSERT INTO events (world_id, type, data, timestamp)
+VALUES (?, ?, ?, ?)
+"""
+_SELECT_EVENTS_SQL = """
+SELECT id, type, data, timestamp FROM events
+WHERE world_id = ?
+ORDER BY timestamp DESC
+LIMIT ?
+"""
+_INSERT_POI_SQL = """
+INSERT INTO pois (id, world_id, data, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    world_id = excluded.world_id,
+    data = excluded.data,
+    updated_at = excluded.updated_at
+"""
+_SELECT_POI_SQL = "SELECT data FROM pois WHERE id = ?"
+_SELECT_WORLD_POIS_SQL = "SELECT id, data FROM pois WHERE world_id = ? ORDER BY rowid"
+_INSERT_LORE_SQL = """
+INSERT OR REPLACE INTO lore (id, world_id, type, title, content, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SELECT_LORE_BY_TYPE_SQL = """
+SELECT id, type, title, content, created_at FROM lore
+WHERE world_id = ? AND type = ?
+ORDER BY created_at
+"""
+_SELECT_LORE_SQL = """
+SELECT id, type, title, content, created_at FROM lore
+WHERE world_id = ?
+ORDER BY created_at
+"""
+_INSERT_TIMELINE_SQL = """
+INSERT INTO timeline (world_id, event_type, description, date, created_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+_SELECT_TIMELINE_SQL = """
+SELECT id, event_type, description, date, created_at FROM timeline
+WHERE world_id = ?
+ORDER BY date
+"""
+
+class _ReadPool:
+    """
+    Bounded pool of read-only database connections.
+    """
+
+    def __init__(self, connections: List[aiosqlite.Connection]):
+        self._connections = connections
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for connection in connections:
+            self._idle.put_nowait(connection)
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Borrow a connection, waiting if all are in use.
+
+        Yields:
+            Read-only aiosqlite connection
+        """
+        connection = await self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
+
+    async def close(self):
+        """
+        Close every connection in the pool.
+        """
+        for connection in self._connections:
+            await connection.close()
+        self._connections = []
 
 class DatabaseManager:
     """
     Manages SQLite database for world persistence.
     """
 
-    def __init__(self, db_path: str = "spectre_world.db"):
+    def __init__(self, db_path: str = "spectre_world.db", read_pool_size: int = READ_POOL_SIZE):
         self.db_path = db_path
+        self.read_pool_size = read_pool_size
         self.connection = None
+        self._read_pool: Optional[_ReadPool] = None
 
     async def initialize(self):
         """
         Initialize database connection and create tables.
+
+        The connection is kept open for the lifetime of the manager and
+        shared by all callers; calling this again is a no-op.
         """
-        self.connection = await aiosqlite.connect(self.db_path)
+        if self.connection:
+            return
+
+        self.connection = await self._connect()
 
         # Create tables
         await self._create_tables()
 
+        # Readers need the file to exist; an in-memory database can't be shared
+        if self.read_pool_size > 0 and self.db_path != ":memory:":
+            readers = [await self._connect(read_only=True) for _ in range(self.read_pool_size)]
+            self._read_pool = _ReadPool(readers)
+
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        """
+        Open a database connection with the server's PRAGMA settings.
+
+        WAL journaling with synchronous=NORMAL avoids a full fsync per
+        commit and lets readers run alongside the writer.
+
+        Args:
+            read_only: Open the database with mode=ro for the reader pool
+
+        Returns:
+            Open aiosqlite connection
+        """
+        if read_only:
+            uri = f"file:{quote(os.path.abspath(self.db_path))}?mode=ro"
+            connection = await aiosqlite.connect(uri, uri=True)
+        else:
+            connection = await aiosqlite.connect(self.db_path)
+            await connection.execute("PRAGMA journal_mode=WAL")
+            await connection.execute("PRAGMA synchronous=NORMAL")
+
+        await connection.execute("PRAGMA busy_timeout=5000")
+        await connection.execute("PRAGMA temp_store=MEMORY")
+        await connection.execute("PRAGMA cache_size=-65536")
+
+        return connection
+
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> str:
+        """
+        Serialize a value for storage as compact JSON.
+
+        Args:
+            data: Dictionary to serialize; None is stored as an empty object
+
+        Returns:
+            JSON string without whitespace between tokens
+        """
+        if data is None or (isinstance(data, dict) and not data):
+            return _EMPTY_JSON
+        return dumps(data, separators=(",", ":"))
+
+    @asynccontextmanager
+    async def _reader(self):
+        """
+        Borrow a connection for read-only queries.
+
+        Falls back to the writer connection when there is no reader pool.
+
+        Yields:
+            aiosqlite connection
+        """
+        if self._read_pool is None:
+            yield self.connection
+        else:
+            async with self._read_pool.connection() as connection:
+                yield connection
+
     async def _create_tables(self):
         """
         Create database tables if they don't exist.
@@ -67,6 +241,8 @@ class DatabaseManager:
         )
         """)
 
+        await cursor.execute("CREATE INDEX IF NOT EXISTS pois_world_id ON pois(world_id)")
+
         # Lore table
         await cursor.execute("""
         CREATE TABLE IF NOT EXISTS lore (
@@ -99,19 +275,23 @@ class DatabaseManager:
         """
         Save world data to database.
 
+        POIs are stored only in the pois table, not in the world row, so
+        the per-POI writes of save_poi are never shadowed by a stale copy.
+
         Args:
             world_id: World identifier
             world_data: World data dictionary
         """
         timestamp = datetime.now().isoformat()
-        data_json = json.dumps(world_data)
+        pois = world_data.get("pois", {})
+        data_json = self._dumps({key: value for key, value in world_data.items() if key != "pois"})
 
         cursor = await self.connection.cursor()
 
-        await cursor.execute("""
-        INSERT OR REPLACE INTO worlds (id, data, created_at, updated_at)
-        VALUES (?, ?, ?, ?)
-        """, (world_id, data_json, timestamp, timestamp))
+        await cursor.execute(_INSERT_WORLD_SQL, (world_id, data_json, timestamp, timestamp))
+
+        # Write the world's POIs in the same transaction
+        await self._insert_pois(world_id, pois.values(), timestamp)
 
         await self.connection.commit()
 
@@ -125,13 +305,25 @@ class DatabaseManager:
         Returns:
             World data dictionary or None if not found
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
+
+            await cursor.execute(_SELECT_WORLD_SQL, (world_id,))
+            result = await cursor.fetchone()
 
-        await cursor.execute("SELECT data FROM worlds WHERE id = ?", (world_id,))
-        result = await cursor.fetchone()
+            if result:
+                await cursor.execute(_SELECT_WORLD_POIS_SQL, (world_id,))
+                poi_rows = await cursor.fetchall()
 
         if result:
-            return json.loads(result[0])
+            world_data = json.loads(result[0])
+            world_data["pois"] = {row[0]: json.loads(row[1]) for row in poi_rows}
+
+            # JSON decoding creates a new string per tile; share one per biome
+            if world_data.get("biomes"):
+                world_data["biomes"] = [[sys.intern(biome) for biome in row] for row in world_data["biomes"]]
+
+            return world_data
         return None
 
     async def list_worlds(self) -> List[str]:
@@ -141,10 +333,11 @@ class DatabaseManager:
         Returns:
             List of world IDs
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
 
-        await cursor.execute("SELECT id FROM worlds")
-        results = await cursor.fetchall()
+            await cursor.execute(_SELECT_WORLD_IDS_SQL)
+            results = await cursor.fetchall()
 
         return [row[0] for row in results]
 
@@ -158,11 +351,11 @@ class DatabaseManager:
         cursor = await self.connection.cursor()
 
         # Delete from all related tables
-        await cursor.execute("DELETE FROM events WHERE world_id = ?", (world_id,))
-        await cursor.execute("DELETE FROM pois WHERE world_id = ?", (world_id,))
-        await cursor.execute("DELETE FROM lore WHERE world_id = ?", (world_id,))
-        await cursor.execute("DELETE FROM timeline WHERE world_id = ?", (world_id,))
-        await cursor.execute("DELETE FROM worlds WHERE id = ?", (world_id,))
+        await cursor.execute(_DELETE_EVENTS_SQL, (world_id,))
+        await cursor.execute(_DELETE_POIS_SQL, (world_id,))
+        await cursor.execute(_DELETE_LORE_SQL, (world_id,))
+        await cursor.execute(_DELETE_TIMELINE_SQL, (world_id,))
+        await cursor.execute(_DELETE_WORLD_SQL, (world_id,))
 
         await self.connection.commit()
 
@@ -176,14 +369,11 @@ class DatabaseManager:
             data: Event data
         """
         timestamp = datetime.now().isoformat()
-        data_json = json.dumps(data)
+        data_json = self._dumps(data)
 
         cursor = await self.connection.cursor()
 
-        await cursor.execute("""
-        INSERT INTO events (world_id, type, data, timestamp)
-        VALUES (?, ?, ?, ?)
-        """, (world_id, event_type, data_json, timestamp))
+        await cursor.execute(_INSERT_EVENT_SQL, (world_id, event_type, data_json, timestamp))
 
         await self.connection.commit()
 
@@ -198,16 +388,12 @@ class DatabaseManager:
         Returns:
             List of event dictionaries
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
 
-        await cursor.execute("""
-        SELECT id, type, data, timestamp FROM events
-        WHERE world_id = ?
-        ORDER BY timestamp DESC
-        LIMIT ?
-        """, (world_id, limit))
+            await cursor.execute(_SELECT_EVENTS_SQL, (world_id, limit))
 
-        results = await cursor.fetchall()
+            results = await cursor.fetchall()
 
         return [{
             "id": row[0],
@@ -226,17 +412,31 @@ class DatabaseManager:
             poi_data: POI data dictionary
         """
         timestamp = datetime.now().isoformat()
-        data_json = json.dumps(poi_data)
+        data_json = self._dumps(poi_data)
 
         cursor = await self.connection.cursor()
 
-        await cursor.execute("""
-        INSERT OR REPLACE INTO pois (id, world_id, data, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?)
-        """, (poi_id, world_id, data_json, timestamp, timestamp))
+        await cursor.execute(_INSERT_POI_SQL, (poi_id, world_id, data_json, timestamp, timestamp))
 
         await self.connection.commit()
 
+    async def _insert_pois(self, world_id: str, pois, timestamp: str):
+        """
+        Upsert POI rows with one executemany call, without committing.
+
+        Existing rows keep their created_at; only data and updated_at change.
+
+        Args:
+            world_id: World identifier
+            pois: Iterable of POI data dictionaries
+            timestamp: Timestamp for created_at/updated_at
+        """
+        rows = [(poi["id"], world_id, self._dumps(poi), timestamp, timestamp) for poi in pois]
+        if not rows:
+            return
+
+        await self.connection.executemany(_INSERT_POI_SQL, rows)
+
     async def load_poi(self, poi_id: str) -> Optional[Dict[str, Any]]:
         """
         Load POI data from database.
@@ -247,10 +447,11 @@ class DatabaseManager:
         Returns:
             POI data dictionary or None if not found
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
 
-        await cursor.execute("SELECT data FROM pois WHERE id = ?", (poi_id,))
-        result = await cursor.fetchone()
+            await cursor.execute(_SELECT_POI_SQL, (poi_id,))
+            result = await cursor.fetchone()
 
         if result:
             return json.loads(result[0])
@@ -271,10 +472,7 @@ class DatabaseManager:
 
         cursor = await self.connection.cursor()
 
-        await cursor.execute("""
-        INSERT OR REPLACE INTO lore (id, world_id, type, title, content, created_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """, (lore_id, world_id, lore_type, title, content, timestamp))
+        await cursor.execute(_INSERT_LORE_SQL, (lore_id, world_id, lore_type, title, content, timestamp))
 
         await self.connection.commit()
 
@@ -289,22 +487,15 @@ class DatabaseManager:
         Returns:
             List of lore dictionaries
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
 
-        if lore_type:
-            await cursor.execute("""
-            SELECT id, type, title, content, created_at FROM lore
-            WHERE world_id = ? AND type = ?
-            ORDER BY created_at
-            """, (world_id, lore_type))
-        else:
-            await cursor.execute("""
-            SELECT id, type, title, content, created_at FROM lore
-            WHERE world_id = ?
-            ORDER BY created_at
-            """, (world_id,))
+            if lore_type:
+                await cursor.execute(_SELECT_LORE_BY_TYPE_SQL, (world_id, lore_type))
+            else:
+                await cursor.execute(_SELECT_LORE_SQL, (world_id,))
 
-        results = await cursor.fetchall()
+            results = await cursor.fetchall()
 
         return [{
             "id": row[0],
@@ -332,10 +523,7 @@ class DatabaseManager:
 
         cursor = await self.connection.cursor()
 
-        await cursor.execute("""
-        INSERT INTO timeline (world_id, event_type, description, date, created_at)
-        VALUES (?, ?, ?, ?, ?)
-        """, (world_id, event_type, description, event_date, timestamp))
+        await cursor.execute(_INSERT_TIMELINE_SQL, (world_id, event_type, description, event_date, timestamp))
 
         await self.connection.commit()
 
@@ -351,15 +539,12 @@ class DatabaseManager:
         Returns:
             List of timeline event dictionaries
         """
-        cursor = await self.connection.cursor()
+        async with self._reader() as connection:
+            cursor = await connection.cursor()
 
-        await cursor.execute("""
-        SELECT id, event_type, description, date, created_at FROM timeline
-        WHERE world_id = ?
-        ORDER BY date
-        """, (world_id,))
+            await cursor.execute(_SELECT_TIMELINE_SQL, (world_id,))
 
-        results = await cursor.fetchall()
+            results = await cursor.fetchall()
 
         return [{
             "id": row[0],
@@ -373,6 +558,10 @@ class DatabaseManager:
         """
         Close database connection.
         """
+        if self._read_pool:
+            await self._read_pool.close()
+            self._read_pool = None
+
         if self.connection:
             await self.connection.close()
             self.connection = None
@@ -384,6 +573,10 @@ class DatabaseManager:
         Args:
             backup_path: Path for backup file
         """
+        # Flush the WAL into the main file so the copy is complete
+        if self.connection:
+            await self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
         import shutil
         shutil.copyfile(self.db_path, backup_path)
 
@@ -426,4 +619,4 @@ def export_json_backup(world_data: Dict[str, Any], backup_path: str):
         backup_path: Path for backup file
     """
     with open(backup_path, 'w') as f:
-        json.dump(world_data, f, indent=2)
\ No newline at end of file
+        dump(world_data, f, indent=2)
\ No newline at end of file
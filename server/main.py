@@ -58,6 +58,7 @@ from events import EventBroadcaster
 from mcp_handler import MCPHandler
 from database import DatabaseManager
 from api import add_router
+from serialization import dumps
 
 # Global state
 app = FastAPI(title="SPECTRE World Generation Server",
@@ -74,7 +75,7 @@ database = DatabaseManager("spectre_world.db")
 mcp_handler = MCPHandler(engine, broadcaster, database)
 
 # Add API router
-add_router(app)
+add_router(app, database)
 
 # CORS middleware
 app.add_middleware(
@@ -110,7 +111,7 @@ async def websocket_endpoint(websocket: WebSocket):
             if event_data:
                 try:
                     # Send event to client
-                    await websocket.send_text(json.dumps(event_data))
+                    await websocket.send_text(dumps(event_data))
                 except Exception as e:
                     log_info(f"Error sending WebSocket message: {e}")
                     break
@@ -136,7 +137,7 @@ async def broadcast_loop():
                 disconnected = []
                 for conn_id, websocket in active_connections.items():
                     try:
-                        await websocket.send_text(json.dumps(event_data))
+                        await websocket.send_text(dumps(event_data))
                     except Exception as e:
                         log_info(f"Error broadcasting to {conn_id}: {e}")
                         disconnected.append(conn_id)
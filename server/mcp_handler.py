@@ -15,6 +15,7 @@ sys.path.append(os.path.dirname(__file__))
 from world_engine import WorldEngine
 from events import EventBroadcaster
 from database import DatabaseManager
+from serialization import dumps, loads
 
 
 def log_info(message: str) -> None:
@@ -26,6 +27,10 @@ class MCPHandler:
     Handles MCP protocol communication via stdio.
     """
 
+    # Response envelopes copied by validate_jsonrpc_response
+    _RESULT_ENVELOPE = {"jsonrpc": "2.0", "id": None, "result": None}
+    _ERROR_ENVELOPE = {"jsonrpc": "2.0", "id": None, "error": None}
+
     def __init__(self, world_engine: WorldEngine, event_broadcaster: EventBroadcaster, database: DatabaseManager):
         self.engine = world_engine
         self.broadcaster = event_broadcaster
@@ -66,23 +71,12 @@ class MCPHandler:
                     if not line:
                         continue
 
-                    # Parse JSON command
-                    try:
-                        command = json.loads(line)
-                        response = self.handle_command(command)
-
-                        # Send response to stdout
-                        print(json.dumps(response))
-                        sys.stdout.flush()
+                    # Parse and handle the command (or a JSON-RPC batch)
+                    response = self.handle_command_bytes(line.encode())
 
-                    except json.JSONDecodeError:
-                        error_response = {
-                            "type": "error",
-                            "message": "Invalid JSON command",
-                            "command": line
-                        }
-                        print(json.dumps(error_response))
-                        sys.stdout.flush()
+                    # Send response to stdout
+                    print(dumps(response))
+                    sys.stdout.flush()
 
                 except KeyboardInterrupt:
                     self.running = False
@@ -102,6 +96,59 @@ class MCPHandler:
 
         log_info("🔌 MCP Handler stopped")
 
+    def handle_command_bytes(self, payload: bytes) -> Any:
+        """
+        Parse and handle a raw JSON-RPC 2.0 payload.
+
+        This is the path stdio input takes: the payload is parsed once with
+        serialization.loads (orjson when installed) and dispatched as a
+        single command or, for a JSON array, as a batch.
+
+        Args:
+            payload: UTF-8 encoded JSON command or batch of commands
+
+        Returns:
+            JSON-RPC 2.0 response dictionary, or a list of them for a batch
+        """
+        try:
+            command = loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32700,
+                    "message": "Parse error: invalid JSON"
+                }
+            }
+
+        if isinstance(command, list):
+            if not command:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32600,
+                        "message": "Invalid command format: empty batch"
+                    }
+                }
+            return self.handle_commands(command)
+
+        return self.handle_command(command)
+
+    def handle_commands(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Handle a JSON-RPC 2.0 batch of MCP commands.
+
+        Args:
+            commands: List of MCP command dictionaries
+
+        Returns:
+            List of JSON-RPC 2.0 compliant responses, in command order
+        """
+        handle_command = self.handle_command
+        return [handle_command(command) for command in commands]
+
     def handle_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle an MCP command with JSON-RPC 2.0 compliance.
@@ -393,7 +440,12 @@ class MCPHandler:
     def _tool_list_pois(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """List all points of interest."""
         world_id = args.get('world_id')
-        pois = self.engine.list_pois(world_id)
+        limit = args.get('limit')
+
+        if limit is None:
+            pois = self.engine.list_pois(world_id)
+        else:
+            pois = self.engine.list_pois_page(world_id, args.get('offset', 0), limit)
 
         return {
             "pois": pois,
@@ -565,28 +617,23 @@ class MCPHandler:
         """
         Validate that a response meets JSON-RPC 2.0 specification.
 
+        The response is rebuilt from a fixed-shape envelope template rather
+        than patched field by field, so the input is left untouched and
+        every response has the same key layout.
+
         Args:
             response: Response dictionary to validate
 
         Returns:
-            Validated response dictionary
+            New JSON-RPC 2.0 response dictionary with jsonrpc, id and exactly
+            one of result (preferred when both are present) or error
         """
-        # Ensure required fields are present
-        if "jsonrpc" not in response:
-            response["jsonrpc"] = "2.0"
-
-        if "id" not in response:
-            response["id"] = None  # Will be replaced by actual command ID in handle_command
-
-        # Ensure proper structure - either result or error, not both
-        has_result = "result" in response
-        has_error = "error" in response
-
-        if has_result and has_error:
-            # Remove error field if result is present
-            del response["error"]
-        elif not has_result and not has_error:
-            # Add result field if neither is present
-            response["result"] = {"status": "success"}
-
-        return response
\ No newline at end of file
+        if "result" in response or "error" not in response:
+            validated = self._RESULT_ENVELOPE.copy()
+            validated["result"] = response["result"] if "result" in response else {"status": "success"}
+        else:
+            validated = self._ERROR_ENVELOPE.copy()
+            validated["error"] = response["error"]
+
+        validated["id"] = response.get("id")
+        return validated
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+SPECTRE World Generation - Serialization Module
+
+JSON encoding helpers for world data that keeps its grids as numpy arrays.
+"""
+
+import json
+from typing import Any, Union
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Convert numpy values for json.dumps.
+
+    World grids stay as numpy arrays in memory and are only converted to
+    nested lists when they are actually written out.
+
+    Args:
+        obj: Object the JSON encoder could not serialize
+
+    Returns:
+        JSON-serializable equivalent
+
+    Raises:
+        TypeError: If the object is not a numpy value
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """
+    Serialize an object to JSON, converting numpy values on the way.
+
+    Args:
+        obj: Object to serialize
+        **kwargs: Extra arguments passed to json.dumps
+
+    Returns:
+        JSON string
+    """
+    return json.dumps(obj, default=json_default, **kwargs)
+
+
+def dump(obj: Any, fp, **kwargs):
+    """
+    Serialize an object to a JSON file, converting numpy values on the way.
+
+    Args:
+        obj: Object to serialize
+        fp: Writable file object
+        **kwargs: Extra arguments passed to json.dump
+    """
+    json.dump(obj, fp, default=json_default, **kwargs)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's
+            JSONDecodeError is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
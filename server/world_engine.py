@@ -7,6 +7,8 @@ Core world generation and management engine.
 import uuid
 import random
 import time
+from collections import OrderedDict, defaultdict
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import numpy as np
@@ -18,6 +20,68 @@ from terrain.noise import PerlinNoise
 from terrain.biomes import BiomeClassifier
 from terrain.mesh import TerrainMeshGenerator
 
+# Number of generated terrains kept for repeat create_world calls
+TERRAIN_CACHE_SIZE = 8
+
+# Side length, in tiles, of the cells in the POI spatial index
+POI_GRID_CELL_SIZE = 8
+
+# NPC generation tables
+_NPC_FIRST_NAMES = ["Aelric", "Brianna", "Cedric", "Daria", "Eamon", "Fiona", "Garrick", "Hilda"]
+_NPC_LAST_NAMES = ["Ironwood", "Stormborn", "Frostveil", "Darkleaf", "Brightforge", "Shadowmere"]
+_NPC_ROLES = {
+    "settlement": ["Mayor", "Blacksmith", "Innkeeper", "Healer", "Guard", "Merchant"],
+    "ruin": ["Ghost", "Scholar", "Adventurer", "Guardian", "Looter", "Historian"],
+    "temple": ["High Priest", "Acolyte", "Paladin", "Seer", "Monk", "Confessor"],
+    "cave": ["Explorer", "Miner", "Bandit", "Hermit", "Beast", "Treasure Hunter"],
+    "fortress": ["Captain", "Soldier", "Armsmaster", "Scout", "Prisoner", "Spymaster"],
+    "mine": ["Foreman", "Miner", "Assayer", "Engineer", "Slave", "Prospector"]
+}
+_NPC_TRAITS = {
+    "settlement": ["welcoming", "hardworking", "wise", "cunning", "generous", "suspicious"],
+    "ruin": ["haunted", "knowledgeable", "brave", "greedy", "cursed", "obsessed"],
+    "temple": ["devout", "mysterious", "peaceful", "fanatical", "enlightened", "ascetic"],
+    "cave": ["tough", "resourceful", "paranoid", "ruthless", "lonely", "determined"],
+    "fortress": ["disciplined", "vigilant", "loyal", "brutal", "strategic", "honorable"],
+    "mine": ["strong", "practical", "greedy", "skilled", "weary", "ambitious"]
+}
+_NPC_FEATURES = ["piercing eyes", "a scarred face", "an air of authority", "a quiet demeanor"]
+_NPC_ALIGNMENTS = ["friendly", "neutral", "hostile", "unpredictable"]
+
+# Rumor templates per POI type: (template, filler options for each positional slot)
+_RUMOR_TEMPLATES = {
+    "settlement": [
+        ("They say {name} was built on {0}.", [['ancient ruins', 'a buried treasure', 'a sacred site', "a dragon's hoard"]]),
+        ("The {0} of {name} is said to be {1}.", [['mayor', 'blacksmith', 'innkeeper'], ['a spy', 'a wizard', 'a vampire', 'a saint']]),
+        ("Travelers whisper that {name} hides {0}.", [['a secret tunnel', 'a magical artifact', 'a cursed relic', 'a portal to another world']])
+    ],
+    "ruin": [
+        ("{name} is haunted by the ghost of {0}.", [['a betrayed king', 'a murdered priestess', 'a fallen warrior', 'a heartbroken lover']]),
+        ("They say {name} was destroyed by {0}.", [['a dragon', 'a curse', 'an ancient weapon', 'divine wrath']]),
+        ("At midnight, the ruins of {name} {0}.", [['glow with eerie light', 'echo with ghostly voices', 'reveal hidden passages', 'come alive with shadows']])
+    ],
+    "temple": [
+        ("{name} is said to grant {0} to those who {1}.", [['visions', 'healing', 'curses', 'blessings'], ['pray sincerely', 'offer sacrifices', 'solve its riddles', 'pass its trials']]),
+        ("The priests of {name} guard a secret {0} that could {1}.", [['artifact', 'ritual', 'truth', 'prophecy'], ['save the world', 'destroy nations', 'unlock ancient power', 'reveal the future']]),
+        ("Once a year, {name} becomes the site of {0}.", [['a miraculous event', 'a terrifying ritual', 'a celestial phenomenon', 'a mystical gathering']])
+    ],
+    "cave": [
+        ("Deep in {name}, there lies {0}.", [['a sleeping beast', 'a hidden treasure', 'an ancient civilization', 'a gateway to the underworld']]),
+        ("Those who enter {name} {0}.", [['never return', 'come back changed', 'hear whispers', 'see visions', 'find what they seek']]),
+        ("{name} is connected to {0}.", [['a network of tunnels', 'an underground kingdom', 'a lost city', 'the elemental planes']])
+    ],
+    "fortress": [
+        ("{name} was built to {0}.", [['protect a secret', 'control the region', 'imprison a monster', 'guard a treasure']]),
+        ("The lord of {name} is {0}.", [['a tyrant', 'a hero', 'a puppet', 'a vampire', 'a secret agent']]),
+        ("Beneath {name}, there are {0}.", [['dungeons filled with prisoners', 'tunnels leading to escape', 'catacombs hiding secrets', 'ancient vaults']])
+    ],
+    "mine": [
+        ("The miners of {name} have uncovered {0}.", [['strange bones', 'ancient runes', 'a glowing ore', 'a buried machine']]),
+        ("{name} is cursed - {0}.", [['accidents happen daily', 'miners go missing', 'the earth itself fights back', 'whispers drive men mad']]),
+        ("Deep in {name}, there's a vein of {0}.", [['pure gold', 'magic-infused crystal', 'blood-red gemstones', 'living metal']])
+    ]
+}
+
 class WorldEngine:
     """
     Core world generation and management engine.
@@ -34,6 +98,12 @@ class WorldEngine:
         self.biome_classifier = BiomeClassifier()
         self.mesh_gen = TerrainMeshGenerator()
 
+        # (width, height, seed, island_mode) -> generated terrain, least recently used first
+        self._terrain_cache: "OrderedDict[Tuple[int, int, int, bool], Tuple[np.ndarray, np.ndarray, np.ndarray, Dict, Dict]]" = OrderedDict()
+
+        # world_id -> {(cell_x, cell_y): [poi_id, ...]} for spatial POI queries
+        self._poi_grids: Dict[str, Dict[Tuple[int, int], List[str]]] = {}
+
     def create_world(self, width: int = 64, height: int = 64, seed: Optional[str] = None, island_mode: bool = True) -> Dict[str, Any]:
         """
         Create a new procedural world.
@@ -50,18 +120,10 @@ class WorldEngine:
         world_id = str(uuid.uuid4())
         seed_value = seed or str(random.randint(0, 1000000))
 
-        # Generate terrain
-        if island_mode:
-            heightmap = self.noise_gen.generate_island_heightmap(width, height, seed=int(seed_value))
-        else:
-            heightmap = self.noise_gen.generate_heightmap(width, height, seed=int(seed_value))
-
-        # Classify biomes
-        moisture_map = self.biome_classifier.generate_moisture_map(heightmap, seed=int(seed_value))
-        biome_grid, biome_stats = self.biome_classifier.classify_heightmap(heightmap, moisture_map)
-
-        # Generate mesh data
-        mesh_data = self.mesh_gen.generate_biome_mesh_data(heightmap, biome_grid)
+        # Generate terrain (or reuse it for a repeated seed)
+        heightmap, moisture_map, biome_grid, biome_stats, mesh_data = self._get_terrain(
+            width, height, int(seed_value), island_mode
+        )
 
         # Create world data
         world_data = {
@@ -71,9 +133,9 @@ class WorldEngine:
             "seed": seed_value,
             "island_mode": island_mode,
             "created_at": datetime.now().isoformat(),
-            "heightmap": heightmap.tolist(),
-            "biomes": biome_grid.tolist(),
-            "moisture": moisture_map.tolist(),
+            "heightmap": heightmap,
+            "biomes": biome_grid,
+            "moisture": moisture_map,
             "mesh": mesh_data,
             "statistics": {
                 "biome_distribution": biome_stats,
@@ -92,6 +154,67 @@ class WorldEngine:
 
         return world_data
 
+    def _get_terrain(self, width: int, height: int, seed: int, island_mode: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict, Dict]:
+        """
+        Get generated terrain for the given parameters, reusing cached results.
+
+        Args:
+            width: World width
+            height: World height
+            seed: Integer random seed
+            island_mode: Generate island-style terrain
+
+        Returns:
+            Tuple of (heightmap, moisture_map, biome_grid, biome_stats, mesh_data)
+        """
+        cache_key = (width, height, seed, island_mode)
+        cached = self._terrain_cache.get(cache_key)
+
+        if cached is None:
+            # Generate terrain
+            if island_mode:
+                heightmap = self.noise_gen.generate_island_heightmap(width, height, seed=seed)
+            else:
+                heightmap = self.noise_gen.generate_heightmap(width, height, seed=seed)
+
+            # Classify biomes
+            moisture_map, biome_grid, biome_stats = self.biome_classifier.generate_biomes(heightmap, seed=seed)
+
+            # Generate mesh data
+            mesh_data = self.mesh_gen.generate_biome_mesh_data(heightmap, biome_grid)
+
+            cached = (heightmap, moisture_map, biome_grid, biome_stats, mesh_data)
+            self._terrain_cache[cache_key] = cached
+            if len(self._terrain_cache) > TERRAIN_CACHE_SIZE:
+                self._terrain_cache.popitem(last=False)
+        else:
+            self._terrain_cache.move_to_end(cache_key)
+
+        # Hand out copies so callers can't mutate the cached terrain
+        heightmap, moisture_map, biome_grid, biome_stats, mesh_data = cached
+        return heightmap.copy(), moisture_map.copy(), biome_grid.copy(), dict(biome_stats), self._copy_mesh(mesh_data)
+
+    @staticmethod
+    def _copy_mesh(mesh_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy cached mesh data down to its lists of numbers.
+
+        The vertex, color and index lists and each biome color are copied;
+        their elements are immutable numbers, so this is a full copy
+        without the cost of copy.deepcopy.
+
+        Args:
+            mesh_data: Mesh data from the terrain cache
+
+        Returns:
+            Mesh data sharing nothing mutable with the cache
+        """
+        mesh = dict(mesh_data)
+        for key in ("vertices", "colors", "indices"):
+            mesh[key] = list(mesh[key])
+        mesh["biome_map"] = {biome: list(color) for biome, color in mesh["biome_map"].items()}
+        return mesh
+
     def get_world(self, world_id: str) -> Optional[Dict[str, Any]]:
         """
         Get world data by ID.
@@ -104,6 +227,26 @@ class WorldEngine:
         """
         return self.worlds.get(world_id)
 
+    def delete_world(self, world_id: str) -> bool:
+        """
+        Remove a world from memory, along with its cached terrain.
+
+        Args:
+            world_id: World identifier
+
+        Returns:
+            True if the world was loaded
+        """
+        self._poi_grids.pop(world_id, None)
+        world = self.worlds.pop(world_id, None)
+        if world is None:
+            return False
+
+        # Other worlds hold their own copies, so dropping the entry is safe
+        cache_key = (world["width"], world["height"], int(world["seed"]), world["island_mode"])
+        self._terrain_cache.pop(cache_key, None)
+        return True
+
     def get_statistics(self, world_id: str) -> Optional[Dict[str, Any]]:
         """
         Get world statistics.
@@ -130,14 +273,19 @@ class WorldEngine:
             y: Y coordinate
 
         Returns:
-            Region data or None
+            Region data, or None if the world is not loaded or the
+            coordinates are outside it
         """
         world = self.get_world(world_id)
         if not world:
             return None
 
-        # Create region key
-        region_key = f"{x},{y}"
+        # The linear tile index below is only unique for in-bounds tiles
+        if not (0 <= x < world["width"] and 0 <= y < world["height"]):
+            return None
+
+        # Linear tile index, cheaper to build and hash than an "x,y" string
+        region_key = y * world["width"] + x
 
         # Get or create region
         if region_key not in world["regions"]:
@@ -179,16 +327,14 @@ class WorldEngine:
         if not region:
             raise ValueError("Region not found")
 
-        region_key = f"{x},{y}"
-
         # Update region
-        world["regions"][region_key]["name"] = name
-        world["regions"][region_key]["discovered"] = True
+        region["name"] = name
+        region["discovered"] = True
 
         # Update statistics
         world["statistics"]["named_regions"] = world["statistics"].get("named_regions", 0) + 1
 
-        return world["regions"][region_key]
+        return region
 
     def describe_region(self, world_id: str, x: int, y: int) -> str:
         """
@@ -213,10 +359,8 @@ class WorldEngine:
         description = self.biome_classifier.generate_biome_description(biome, region_name)
 
         # Update region
-        region_key = f"{x},{y}"
-        world = self.get_world(world_id)
-        world["regions"][region_key]["description"] = description
-        world["regions"][region_key]["explored"] = True
+        region["description"] = description
+        region["explored"] = True
 
         return description
 
@@ -263,6 +407,28 @@ class WorldEngine:
 
         return list(world["pois"].values())
 
+    def list_pois_page(self, world_id: str, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """
+        List a page of points of interest in a world.
+
+        Only the requested slice is materialized, so paging through a large
+        world doesn't copy every POI on each request.
+
+        Args:
+            world_id: World identifier
+            offset: Number of POIs to skip
+            limit: Maximum number of POIs to return
+
+        Returns:
+            List of POI dictionaries
+        """
+        world = self.get_world(world_id)
+        if not world:
+            return []
+
+        offset = max(offset, 0)
+        return list(islice(world["pois"].values(), offset, offset + max(limit, 0)))
+
     def create_poi(self, world_id: str, poi_type: str, x: int, y: int, name: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a new point of interest.
@@ -308,7 +474,8 @@ class WorldEngine:
             "created_at": datetime.now().isoformat()
         }
 
-        # Add to world
+        # Add to world and the spatial index
+        self._poi_grid(world_id)[self._poi_cell(x, y)].append(poi_id)
         world["pois"][poi_id] = poi_data
         world["statistics"]["poi_count"] = len(world["pois"])
 
@@ -325,17 +492,87 @@ class WorldEngine:
 
         Returns:
             Updated POI data
+
+        Raises:
+            ValueError: If the POI is not found or the new coordinates are
+                not numbers; the POI is left unchanged
         """
         world = self.get_world(world_id)
         if not world or poi_id not in world["pois"]:
             raise ValueError("POI not found")
 
+        poi = world["pois"][poi_id]
+        old_cell = self._poi_cell(poi["x"], poi["y"])
+
+        # Validate the move before touching the POI so it and the index agree
+        try:
+            new_cell = self._poi_cell(updates.get("x", poi["x"]), updates.get("y", poi["y"]))
+        except TypeError:
+            raise ValueError("POI coordinates must be numbers")
+
         # Apply updates
         for key, value in updates.items():
-            if key in world["pois"][poi_id]:
-                world["pois"][poi_id][key] = value
+            if key in poi:
+                poi[key] = value
 
-        return world["pois"][poi_id]
+        # Keep the spatial index in step with moved POIs
+        if new_cell != old_cell:
+            grid = self._poi_grid(world_id)
+            grid[old_cell].remove(poi_id)
+            if not grid[old_cell]:
+                del grid[old_cell]
+            grid[new_cell].append(poi_id)
+
+        return poi
+
+    def get_pois_near(self, world_id: str, x: int, y: int, radius: float) -> List[Dict]:
+        """
+        List points of interest within a radius of a tile.
+
+        Only the grid cells overlapping the query window are inspected.
+
+        Args:
+            world_id: World identifier
+            x: X coordinate
+            y: Y coordinate
+            radius: Search radius in tiles
+
+        Returns:
+            List of POI dictionaries, in no particular order
+        """
+        world = self.get_world(world_id)
+        if not world:
+            return []
+
+        grid = self._poi_grid(world_id)
+        min_cx, min_cy = self._poi_cell(x - radius, y - radius)
+        max_cx, max_cy = self._poi_cell(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        nearby = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                for poi_id in grid.get((cx, cy), ()):
+                    poi = world["pois"][poi_id]
+                    if (poi["x"] - x) ** 2 + (poi["y"] - y) ** 2 <= radius_sq:
+                        nearby.append(poi)
+
+        return nearby
+
+    def _poi_grid(self, world_id: str) -> Dict[Tuple[int, int], List[str]]:
+        """Get the spatial POI index for a world, building it if needed."""
+        grid = self._poi_grids.get(world_id)
+        if grid is None:
+            grid = defaultdict(list)
+            for poi in self.worlds[world_id]["pois"].values():
+                grid[self._poi_cell(poi["x"], poi["y"])].append(poi["id"])
+            self._poi_grids[world_id] = grid
+        return grid
+
+    @staticmethod
+    def _poi_cell(x: float, y: float) -> Tuple[int, int]:
+        """Get the POI index cell containing a position."""
+        return int(x // POI_GRID_CELL_SIZE), int(y // POI_GRID_CELL_SIZE)
 
     def detail_poi(self, world_id: str, poi_id: str, detail_level: str = "medium") -> Dict[str, Any]:
         """
@@ -358,7 +595,7 @@ class WorldEngine:
 
         # Generate NPCs
         npc_count = 3 if detail_level == "high" else 2 if detail_level == "medium" else 1
-        poi["npcs"] = [self._generate_npc(poi_type) for _ in range(npc_count)]
+        poi["npcs"] = self._generate_npcs(poi_type, npc_count)
 
         # Generate rumors
         rumor_count = 5 if detail_level == "high" else 3 if detail_level == "medium" else 1
@@ -483,77 +720,39 @@ class WorldEngine:
 
         return descriptions.get(poi_type, f"{name} is a place of mystery and wonder.")
 
-    def _generate_npc(self, poi_type: str) -> Dict[str, Any]:
-        """Generate an NPC for a POI."""
-        first_names = ["Aelric", "Brianna", "Cedric", "Daria", "Eamon", "Fiona", "Garrick", "Hilda"]
-        last_names = ["Ironwood", "Stormborn", "Frostveil", "Darkleaf", "Brightforge", "Shadowmere"]
-
-        roles = {
-            "settlement": ["Mayor", "Blacksmith", "Innkeeper", "Healer", "Guard", "Merchant"],
-            "ruin": ["Ghost", "Scholar", "Adventurer", "Guardian", "Looter", "Historian"],
-            "temple": ["High Priest", "Acolyte", "Paladin", "Seer", "Monk", "Confessor"],
-            "cave": ["Explorer", "Miner", "Bandit", "Hermit", "Beast", "Treasure Hunter"],
-            "fortress": ["Captain", "Soldier", "Armsmaster", "Scout", "Prisoner", "Spymaster"],
-            "mine": ["Foreman", "Miner", "Assayer", "Engineer", "Slave", "Prospector"]
-        }
-
-        return {
-            "id": f"npc_{uuid.uuid4().hex[:8]}",
-            "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-            "role": random.choice(roles.get(poi_type, ["Mysterious Figure"])),
-            "description": self._generate_npc_description(poi_type),
-            "alignment": random.choice(["friendly", "neutral", "hostile", "unpredictable"])
-        }
-
-    def _generate_npc_description(self, poi_type: str) -> str:
-        """Generate description for an NPC."""
-        traits = {
-            "settlement": ["welcoming", "hardworking", "wise", "cunning", "generous", "suspicious"],
-            "ruin": ["haunted", "knowledgeable", "brave", "greedy", "cursed", "obsessed"],
-            "temple": ["devout", "mysterious", "peaceful", "fanatical", "enlightened", "ascetic"],
-            "cave": ["tough", "resourceful", "paranoid", "ruthless", "lonely", "determined"],
-            "fortress": ["disciplined", "vigilant", "loyal", "brutal", "strategic", "honorable"],
-            "mine": ["strong", "practical", "greedy", "skilled", "weary", "ambitious"]
-        }
-
-        return f"A {random.choice(traits.get(poi_type, ['mysterious']))} individual with {random.choice([' piercing eyes', ' a scarred face', ' an air of authority', ' a quiet demeanor'])}."
+    def _generate_npcs(self, poi_type: str, count: int) -> List[Dict[str, Any]]:
+        """Generate a batch of NPCs for a POI."""
+        roles = _NPC_ROLES.get(poi_type, ["Mysterious Figure"])
+        traits = _NPC_TRAITS.get(poi_type, ["mysterious"])
+
+        first_names = random.choices(_NPC_FIRST_NAMES, k=count)
+        last_names = random.choices(_NPC_LAST_NAMES, k=count)
+        npc_roles = random.choices(roles, k=count)
+        npc_traits = random.choices(traits, k=count)
+        features = random.choices(_NPC_FEATURES, k=count)
+        alignments = random.choices(_NPC_ALIGNMENTS, k=count)
+
+        return [
+            {
+                "id": f"npc_{uuid.uuid4().hex[:8]}",
+                "name": f"{first} {last}",
+                "role": role,
+                "description": f"A {trait} individual with {feature}.",
+                "alignment": alignment
+            }
+            for first, last, role, trait, feature, alignment
+            in zip(first_names, last_names, npc_roles, npc_traits, features, alignments)
+        ]
 
     def _generate_rumor(self, poi_type: str, poi_name: str) -> str:
         """Generate a rumor about a POI."""
-        rumor_types = {
-            "settlement": [
-                f"They say {poi_name} was built on {random.choice(['ancient ruins', 'a buried treasure', 'a sacred site', 'a dragon\'s hoard'])}.",
-                f"The {random.choice(['mayor', 'blacksmith', 'innkeeper'])} of {poi_name} is said to be {random.choice(['a spy', 'a wizard', 'a vampire', 'a saint'])}.",
-                f"Travelers whisper that {poi_name} hides {random.choice(['a secret tunnel', 'a magical artifact', 'a cursed relic', 'a portal to another world'])}."
-            ],
-            "ruin": [
-                f"{poi_name} is haunted by the ghost of {random.choice(['a betrayed king', 'a murdered priestess', 'a fallen warrior', 'a heartbroken lover'])}.",
-                f"They say {poi_name} was destroyed by {random.choice(['a dragon', 'a curse', 'an ancient weapon', 'divine wrath'])}.",
-                f"At midnight, the ruins of {poi_name} {random.choice(['glow with eerie light', 'echo with ghostly voices', 'reveal hidden passages', 'come alive with shadows'])}."
-            ],
-            "temple": [
-                f"{poi_name} is said to grant {random.choice(['visions', 'healing', 'curses', 'blessings'])} to those who {random.choice(['pray sincerely', 'offer sacrifices', 'solve its riddles', 'pass its trials'])}.",
-                f"The priests of {poi_name} guard a secret {random.choice(['artifact', 'ritual', 'truth', 'prophecy'])} that could {random.choice(['save the world', 'destroy nations', 'unlock ancient power', 'reveal the future'])}.",
-                f"Once a year, {poi_name} becomes the site of {random.choice(['a miraculous event', 'a terrifying ritual', 'a celestial phenomenon', 'a mystical gathering'])}."
-            ],
-            "cave": [
-                f"Deep in {poi_name}, there lies {random.choice(['a sleeping beast', 'a hidden treasure', 'an ancient civilization', 'a gateway to the underworld'])}.",
-                f"Those who enter {poi_name} {random.choice(['never return', 'come back changed', 'hear whispers', 'see visions', 'find what they seek'])}.",
-                f"{poi_name} is connected to {random.choice(['a network of tunnels', 'an underground kingdom', 'a lost city', 'the elemental planes'])}."
-            ],
-            "fortress": [
-                f"{poi_name} was built to {random.choice(['protect a secret', 'control the region', 'imprison a monster', 'guard a treasure'])}.",
-                f"The lord of {poi_name} is {random.choice(['a tyrant', 'a hero', 'a puppet', 'a vampire', 'a secret agent'])}.",
-                f"Beneath {poi_name}, there are {random.choice(['dungeons filled with prisoners', 'tunnels leading to escape', 'catacombs hiding secrets', 'ancient vaults'])}."
-            ],
-            "mine": [
-                f"The miners of {poi_name} have uncovered {random.choice(['strange bones', 'ancient runes', 'a glowing ore', 'a buried machine'])}.",
-                f"{poi_name} is cursed - {random.choice(['accidents happen daily', 'miners go missing', 'the earth itself fights back', 'whispers drive men mad'])}.",
-                f"Deep in {poi_name}, there's a vein of {random.choice(['pure gold', 'magic-infused crystal', 'blood-red gemstones', 'living metal'])}."
-            ]
-        }
+        templates = _RUMOR_TEMPLATES.get(poi_type)
+        if not templates:
+            return f"Strange things happen at {poi_name}."
 
-        return random.choice(rumor_types.get(poi_type, [f"Strange things happen at {poi_name}."]))
+        # Pick the template first so only its own fillers are sampled
+        template, fillers = random.choice(templates)
+        return template.format(*[random.choice(options) for options in fillers], name=poi_name)
 
     def _generate_secret(self, poi_type: str) -> str:
         """Generate a secret about a POI."""
@@ -627,9 +826,10 @@ class WorldEngine:
             method=random.choice(methods)
         )
 
-        # Add world-specific elements
-        if world.get("biomes"):
-            dominant_biome = max(world["biomes"], key=lambda x: list(world["biomes"].values()).count(x))
+        # Add world-specific elements, using the biome counts computed at creation
+        biome_distribution = world.get("statistics", {}).get("biome_distribution")
+        if biome_distribution:
+            dominant_biome = max(biome_distribution, key=biome_distribution.get)
             myth += f" The first land to rise was {self.biome_classifier.generate_biome_description(dominant_biome)}."
 
         return myth
@@ -5,6 +5,7 @@ Classifies terrain into different biome types based on height and moisture.
 """
 
 from typing import Dict, List, Tuple, Optional
+import sys
 import numpy as np
 
 class BiomeClassifier:
@@ -12,7 +13,32 @@ class BiomeClassifier:
     Classifies terrain into different biome types based on elevation and moisture.
     """
 
-    def __init__(self):
+    # Region description templates per biome, formatted with region_name
+    _DESCRIPTION_TEMPLATES = {
+        'ocean': "The endless {region_name} stretches as far as the eye can see, its dark waters hiding ancient secrets beneath the waves.",
+        'beach': "The golden sands of {region_name} glisten under the sun, where the tide whispers tales of distant lands.",
+        'swamp': "{region_name} is a misty labyrinth of stagnant waters and gnarled roots, where few dare to tread.",
+        'forest': "The ancient trees of {region_name} tower overhead, their canopy filtering the sunlight into dappled patterns on the forest floor.",
+        'jungle': "{region_name} teems with life, its dense foliage hiding both danger and wonder in equal measure.",
+        'grassland': "The rolling grasslands of {region_name} sway gently in the breeze, home to herds of wild creatures.",
+        'plains': "{region_name} offers unbroken vistas, where the wind carries stories across the open land.",
+        'desert': "The scorching sands of {region_name} shimmer under the relentless sun, a harsh land that tests all who enter.",
+        'hills': "{region_name} rises in gentle slopes, offering panoramic views of the surrounding countryside.",
+        'mountain': "The jagged peaks of {region_name} pierce the clouds, their slopes treacherous but rich with mineral wealth.",
+        'snow': "{region_name}'s frozen peaks glisten with eternal ice, a realm of silence and beauty.",
+        'tundra': "The vast, windswept expanse of {region_name} stretches endlessly, a harsh but beautiful wilderness."
+    }
+
+    # Info returned for biomes without a definition
+    _UNKNOWN_BIOME = {
+        'color': (128, 128, 128),
+        'description': 'Unknown biome'
+    }
+
+    def __init__(self, seed: Optional[int] = None):
+        # Instance random generator, used when no seed or generator is given
+        self._rng = np.random.default_rng(seed)
+
         # Define biome thresholds and characteristics
         self.biome_definitions = {
             'ocean': {
@@ -89,6 +115,20 @@ class BiomeClassifier:
             }
         }
 
+        # Flattened biome ranges for array classification, indexed by biome id
+        self._names = [sys.intern(name) for name in self.biome_definitions]
+        self._names_array = np.array(self._names, dtype=object)
+        self._h_lo = np.array([b['height'][0] for b in self.biome_definitions.values()])
+        self._h_hi = np.array([b['height'][1] for b in self.biome_definitions.values()])
+        self._m_lo = np.array([b['moisture'][0] for b in self.biome_definitions.values()])
+        self._m_hi = np.array([b['moisture'][1] for b in self.biome_definitions.values()])
+        self._default_id = self._names.index('plains')
+
+        # Lookup table over elementary height/moisture intervals
+        self._h_edges = np.unique(np.concatenate([self._h_lo, self._h_hi]))
+        self._m_edges = np.unique(np.concatenate([self._m_lo, self._m_hi]))
+        self._biome_lut = self._build_biome_lut()
+
     def classify_tile(self, height: float, moisture: float) -> str:
         """
         Classify a tile based on height and moisture levels.
@@ -110,26 +150,27 @@ class BiomeClassifier:
 
         return 'plains'  # Default biome
 
-    def generate_moisture_map(self, heightmap: np.ndarray, seed: int = None) -> np.ndarray:
+    def generate_moisture_map(self, heightmap: np.ndarray, seed: int = None,
+                              rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Generate moisture map based on heightmap.
 
         Args:
             heightmap: Input heightmap
             seed: Random seed
+            rng: Optional random generator, e.g. one per worker thread
 
         Returns:
             2D moisture map
         """
-        if seed is not None:
-            np.random.seed(seed)
-
-        # Base moisture is inversely related to height (higher = drier)
-        moisture = 1.0 - heightmap
+        if rng is None:
+            rng = np.random.default_rng(seed) if seed is not None else self._rng
 
-        # Add some random variation
-        noise = np.random.normal(0, 0.1, heightmap.shape)
-        moisture = np.clip(moisture + noise, 0, 1)
+        # Base moisture is inversely related to height (higher = drier),
+        # plus some random variation; the noise buffer holds the result
+        moisture = rng.normal(0, 0.1, heightmap.shape)
+        np.add(1.0 - heightmap, moisture, out=moisture)
+        np.clip(moisture, 0, 1, out=moisture)
 
         return moisture
 
@@ -147,26 +188,169 @@ class BiomeClassifier:
         if moisture_map is None:
             moisture_map = self.generate_moisture_map(heightmap)
 
+        biome_ids = self.classify_ids(heightmap, moisture_map)
+
+        return self._names_array[biome_ids], self._count_biomes(biome_ids)
+
+    def generate_biomes(self, heightmap: np.ndarray, seed: int = None,
+                        rng: Optional[np.random.Generator] = None,
+                        block_rows: int = 64) -> Tuple[np.ndarray, np.ndarray, Dict]:
+        """
+        Generate the moisture map and classify biomes in one pass.
+
+        Equivalent to generate_moisture_map() followed by classify_heightmap(),
+        but each block of rows is turned into moisture and classified while it
+        is still in cache, instead of writing out the whole moisture map and
+        reading it back.
+
+        Args:
+            heightmap: Input heightmap
+            seed: Random seed
+            rng: Optional random generator
+            block_rows: Rows processed per block
+
+        Returns:
+            Tuple of (moisture_map, biome_grid, biome_statistics)
+        """
+        if rng is None:
+            rng = np.random.default_rng(seed) if seed is not None else self._rng
+
+        # Draw all noise at once so the values match generate_moisture_map
+        moisture = rng.normal(0, 0.1, heightmap.shape)
+        biome_ids = np.empty(heightmap.shape, dtype=np.int8)
+
+        for start in range(0, heightmap.shape[0], block_rows):
+            rows = slice(start, start + block_rows)
+            block = moisture[rows]
+            np.add(1.0 - heightmap[rows], block, out=block)
+            np.clip(block, 0, 1, out=block)
+
+            height_bins = self._interval_index(heightmap[rows], self._h_edges)
+            moisture_bins = self._interval_index(block, self._m_edges)
+            biome_ids[rows] = self._biome_lut[height_bins, moisture_bins]
+
+        return moisture, self._names_array[biome_ids], self._count_biomes(biome_ids)
+
+    def _count_biomes(self, biome_ids: np.ndarray) -> Dict[str, int]:
+        """Count tiles per biome, keeping first-seen order."""
+        ids, first_index, counts = np.unique(biome_ids, return_index=True, return_counts=True)
+        order = np.argsort(first_index)
+
+        return {self._names[ids[i]]: int(counts[i]) for i in order}
+
+    def classify_tiles(self, heightmap: np.ndarray, moisture_map: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Classify a heightmap into a struct-of-arrays tile table.
+
+        Every field is a grid aligned with the heightmap; biome holds ids
+        into palette. Use get_tile() to read a single tile as a dictionary.
+
+        Args:
+            heightmap: Input heightmap
+            moisture_map: Optional moisture map
+
+        Returns:
+            Dictionary with x, y, elevation, moisture, biome and palette
+        """
+        if moisture_map is None:
+            moisture_map = self.generate_moisture_map(heightmap)
+
         rows, cols = heightmap.shape
-        biome_grid = np.empty((rows, cols), dtype=object)
 
-        biome_counts = {}
+        return {
+            'x': np.broadcast_to(np.arange(cols), (rows, cols)),
+            'y': np.broadcast_to(np.arange(rows)[:, np.newaxis], (rows, cols)),
+            'elevation': heightmap,
+            'moisture': moisture_map,
+            'biome': self.classify_ids(heightmap, moisture_map),
+            'palette': self._names
+        }
+
+    @staticmethod
+    def get_tile(tiles: Dict[str, np.ndarray], x: int, y: int) -> Dict:
+        """
+        Get a single tile from a classify_tiles() table.
+
+        Args:
+            tiles: Tile table from classify_tiles()
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Tile dictionary
+        """
+        return {
+            'x': x,
+            'y': y,
+            'elevation': float(tiles['elevation'][y, x]),
+            'moisture': float(tiles['moisture'][y, x]),
+            'biome': tiles['palette'][tiles['biome'][y, x]]
+        }
+
+    def classify_ids(self, heightmap: np.ndarray, moisture_map: np.ndarray) -> np.ndarray:
+        """
+        Classify a heightmap into integer biome ids.
+
+        Ids index into the biome definition order. Each value is binned
+        against the range edges and the biome is read from a lookup table
+        built with classify_tile, so results match it exactly.
+
+        Args:
+            heightmap: Input heightmap
+            moisture_map: Moisture map with the same shape
+
+        Returns:
+            int8 grid of biome ids
+        """
+        height_bins = self._interval_index(heightmap, self._h_edges)
+        moisture_bins = self._interval_index(moisture_map, self._m_edges)
+
+        return self._biome_lut[height_bins, moisture_bins]
 
-        for y in range(rows):
-            for x in range(cols):
-                height = heightmap[y, x]
-                moisture = moisture_map[y, x]
-                biome = self.classify_tile(height, moisture)
+    @staticmethod
+    def _interval_index(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """
+        Map values to elementary interval indices around sorted edges.
+
+        Index 2*i is the open interval below edges[i] (and above
+        edges[i-1]); index 2*i + 1 is exactly edges[i]. Range checks are
+        inclusive, so edge values need their own bins.
+
+        Args:
+            values: Values to bin
+            edges: Sorted unique range boundaries
+
+        Returns:
+            Integer array of interval indices
+        """
+        index = np.searchsorted(edges, values, side='left')
+        on_edge = edges[np.minimum(index, len(edges) - 1)] == values
+
+        return 2 * index + on_edge
+
+    @staticmethod
+    def _interval_representatives(edges: np.ndarray) -> np.ndarray:
+        """Get one sample value inside each elementary interval of the edges."""
+        midpoints = (edges[:-1] + edges[1:]) / 2
+        open_intervals = np.concatenate([[edges[0] - 1.0], midpoints, [edges[-1] + 1.0]])
+
+        representatives = np.empty(2 * len(edges) + 1)
+        representatives[0::2] = open_intervals
+        representatives[1::2] = edges
 
-                biome_grid[y, x] = biome
+        return representatives
 
-                # Count biomes
-                if biome in biome_counts:
-                    biome_counts[biome] += 1
-                else:
-                    biome_counts[biome] = 1
+    def _build_biome_lut(self) -> np.ndarray:
+        """Build the (height interval, moisture interval) -> biome id table."""
+        height_values = self._interval_representatives(self._h_edges)
+        moisture_values = self._interval_representatives(self._m_edges)
 
-        return biome_grid, biome_counts
+        biome_lut = np.empty((len(height_values), len(moisture_values)), dtype=np.int8)
+        for hi, height in enumerate(height_values):
+            for mi, moisture in enumerate(moisture_values):
+                biome_lut[hi, mi] = self._names.index(self.classify_tile(height, moisture))
+
+        return biome_lut
 
     def get_biome_info(self, biome_name: str) -> Dict:
         """
@@ -178,10 +362,16 @@ class BiomeClassifier:
         Returns:
             Biome information dictionary
         """
-        return self.biome_definitions.get(biome_name, {
-            'color': (128, 128, 128),
-            'description': 'Unknown biome'
-        })
+        return self.biome_definitions.get(biome_name, self._UNKNOWN_BIOME)
+
+    def get_color_palette(self) -> np.ndarray:
+        """
+        Get biome colors as a palette indexed by biome id.
+
+        Returns:
+            (N, 3) uint8 array of RGB colors in classify_ids() order
+        """
+        return np.array([self.biome_definitions[name]['color'] for name in self._names], dtype=np.uint8)
 
     def generate_biome_description(self, biome_name: str, region_name: str = None) -> str:
         """
@@ -198,22 +388,11 @@ class BiomeClassifier:
         base_desc = biome_info['description']
 
         if region_name:
-            descriptions = {
-                'ocean': f"The endless {region_name} stretches as far as the eye can see, its dark waters hiding ancient secrets beneath the waves.",
-                'beach': f"The golden sands of {region_name} glisten under the sun, where the tide whispers tales of distant lands.",
-                'swamp': f"{region_name} is a misty labyrinth of stagnant waters and gnarled roots, where few dare to tread.",
-                'forest': f"The ancient trees of {region_name} tower overhead, their canopy filtering the sunlight into dappled patterns on the forest floor.",
-                'jungle': f"{region_name} teems with life, its dense foliage hiding both danger and wonder in equal measure.",
-                'grassland': f"The rolling grasslands of {region_name} sway gently in the breeze, home to herds of wild creatures.",
-                'plains': f"{region_name} offers unbroken vistas, where the wind carries stories across the open land.",
-                'desert': f"The scorching sands of {region_name} shimmer under the relentless sun, a harsh land that tests all who enter.",
-                'hills': f"{region_name} rises in gentle slopes, offering panoramic views of the surrounding countryside.",
-                'mountain': f"The jagged peaks of {region_name} pierce the clouds, their slopes treacherous but rich with mineral wealth.",
-                'snow': f"{region_name}'s frozen peaks glisten with eternal ice, a realm of silence and beauty.",
-                'tundra': f"The vast, windswept expanse of {region_name} stretches endlessly, a harsh but beautiful wilderness."
-            }
+            template = self._DESCRIPTION_TEMPLATES.get(biome_name)
+            if template:
+                return template.format(region_name=region_name)
 
-            return descriptions.get(biome_name, f"{region_name} is a region dominated by {base_desc}.")
+            return f"{region_name} is a region dominated by {base_desc}."
 
         return base_desc.capitalize()
 
@@ -228,33 +407,16 @@ if __name__ == "__main__":
 
     # Classify biomes
     classifier = BiomeClassifier()
-    biome_grid, biome_stats = classifier.classify_heightmap(heightmap)
+    moisture_map = classifier.generate_moisture_map(heightmap)
+    biome_grid, biome_stats = classifier.classify_heightmap(heightmap, moisture_map)
 
     print("Biome Statistics:")
     for biome, count in biome_stats.items():
         print(f"{biome}: {count} tiles")
 
     # Create biome visualization
-    biome_colors = {
-        'ocean': (0, 100, 200),
-        'beach': (240, 220, 180),
-        'swamp': (80, 120, 60),
-        'forest': (40, 120, 60),
-        'jungle': (30, 140, 30),
-        'grassland': (100, 160, 80),
-        'plains': (160, 200, 120),
-        'desert': (200, 180, 140),
-        'hills': (140, 120, 90),
-        'mountain': (120, 120, 120),
-        'snow': (240, 240, 240),
-        'tundra': (180, 200, 220)
-    }
-
-    colored_biome = np.zeros((*biome_grid.shape, 3), dtype=np.uint8)
-    for y in range(biome_grid.shape[0]):
-        for x in range(biome_grid.shape[1]):
-            biome = biome_grid[y, x]
-            colored_biome[y, x] = biome_colors.get(biome, (128, 128, 128))
+    palette = classifier.get_color_palette()
+    colored_biome = palette[classifier.classify_ids(heightmap, moisture_map)]
 
     plt.figure(figsize=(10, 10))
     plt.imshow(colored_biome)
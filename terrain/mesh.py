@@ -6,88 +6,219 @@ Converts heightmaps to 3D mesh data for visualization.
 
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+import base64
 import json
+import os
 
 class TerrainMeshGenerator:
     """
     Generates 3D mesh data from heightmaps for Three.js visualization.
     """
 
-    def __init__(self):
-        pass
+    # Biome weights for POI likelihood
+    _POI_BIOME_WEIGHTS = {
+        'ocean': 0.1,    # Few POIs in deep ocean
+        'beach': 0.5,    # Good for ports, shipwrecks
+        'swamp': 0.8,    # Great for ruins, hidden places
+        'forest': 0.9,   # Excellent for settlements, temples
+        'jungle': 1.0,   # Best for ancient ruins
+        'grassland': 0.7,
+        'plains': 0.6,
+        'desert': 0.7,   # Good for oases, ruins
+        'hills': 0.8,    # Good for watchtowers, mines
+        'mountain': 0.4, # Some mountain passes, caves
+        'snow': 0.2,     # Few snow POIs
+        'tundra': 0.3
+    }
+
+    # Biome colors, plus the same table as a palette with a grey fallback row
+    _BIOME_COLOR_MAP = {
+        'ocean': [0.0, 0.4, 0.8],
+        'beach': [0.9, 0.8, 0.6],
+        'swamp': [0.3, 0.5, 0.2],
+        'forest': [0.1, 0.4, 0.1],
+        'jungle': [0.1, 0.5, 0.1],
+        'grassland': [0.4, 0.6, 0.3],
+        'plains': [0.6, 0.7, 0.4],
+        'desert': [0.8, 0.7, 0.5],
+        'hills': [0.5, 0.4, 0.3],
+        'mountain': [0.5, 0.5, 0.5],
+        'snow': [0.9, 0.9, 0.9],
+        'tundra': [0.7, 0.8, 0.9]
+    }
+    _BIOME_PALETTE_INDEX = {biome: i for i, biome in enumerate(_BIOME_COLOR_MAP)}
+    _BIOME_PALETTE = np.array(list(_BIOME_COLOR_MAP.values()) + [[0.5, 0.5, 0.5]])
+
+    # Binary encoding used for each array field by save_mesh_to_json
+    _BINARY_FIELD_DTYPES = {
+        'vertices': np.float32,
+        'colors': np.float32,
+        'buffer': np.float32
+    }
+
+    # Height color bands: heights below each threshold take the matching color
+    _HEIGHT_THRESHOLDS = np.array([0.1, 0.2, 0.5, 0.7, 0.9])
+    _HEIGHT_PALETTE = np.array([
+        [0, 0.4, 0.8],    # Water
+        [0.9, 0.8, 0.6],  # Sand
+        [0.2, 0.6, 0.2],  # Grass
+        [0.1, 0.4, 0.1],  # Forest
+        [0.5, 0.5, 0.5],  # Mountain
+        [0.9, 0.9, 0.9]   # Snow
+    ])
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the mesh generator.
+
+        Args:
+            seed: Random seed for reproducible POI placement
+        """
+        self.rng = np.random.default_rng(seed)
 
-    def generate_mesh_data(self, heightmap: np.ndarray, scale: float = 1.0) -> Dict:
+    def generate_mesh_data(self, heightmap: np.ndarray, scale: float = 1.0, layout: str = 'soa') -> Dict:
         """
         Generate Three.js compatible mesh data from heightmap.
 
         Args:
             heightmap: 2D heightmap array
             scale: Vertical scale factor
+            layout: 'soa' for separate vertices/colors lists, or 'interleaved'
+                for a single float32 [x, y, z, r, g, b] buffer
 
         Returns:
             Dictionary with mesh data (vertices, indices, normals, colors)
+
+        Raises:
+            ValueError: If the layout is not recognised
         """
+        if layout not in ('soa', 'interleaved'):
+            raise ValueError(f"Unknown mesh layout: {layout}")
+
         rows, cols = heightmap.shape
-        vertices = []
-        colors = []
-        indices = []
-
-        # Generate vertices and colors
-        for z in range(rows):
-            for x in range(cols):
-                y = heightmap[z, x] * scale
-                vertices.extend([x, y, z])
-
-                # Simple color based on height
-                color = self._get_height_color(y / scale)
-                colors.extend(color)
-
-        # Generate indices (two triangles per quad)
-        for z in range(rows - 1):
-            for x in range(cols - 1):
-                # Triangle 1
-                indices.extend([
-                    z * cols + x,
-                    z * cols + x + 1,
-                    (z + 1) * cols + x
-                ])
-
-                # Triangle 2
-                indices.extend([
-                    (z + 1) * cols + x,
-                    z * cols + x + 1,
-                    (z + 1) * cols + x + 1
-                ])
+
+        vertices = self._grid_vertices(heightmap, scale)
+
+        # Color each vertex by its normalized height
+        colors = self._get_height_colors(vertices[:, 1] / scale)
+
+        # Two triangles per quad
+        indices = self._grid_indices(rows, cols).tolist()
+
+        if layout == 'interleaved':
+            # One vertex stream: position and color share a 6-float stride
+            buffer = np.empty((rows * cols, 6), dtype=np.float32)
+            buffer[:, :3] = vertices
+            buffer[:, 3:] = colors
+
+            return {
+                'buffer': buffer.ravel().tolist(),
+                'stride': 6,
+                'indices': indices,
+                'width': cols,
+                'height': rows,
+                'scale': scale
+            }
 
         return {
-            'vertices': vertices,
-            'colors': colors,
+            'vertices': vertices.ravel().tolist(),
+            'colors': colors.ravel().tolist(),
             'indices': indices,
             'width': cols,
             'height': rows,
             'scale': scale
         }
 
+    def _grid_vertices(self, heightmap: np.ndarray, scale: float, dtype=np.float64) -> np.ndarray:
+        """
+        Build one [x, y, z] vertex per heightmap cell, row by row.
+
+        Args:
+            heightmap: 2D heightmap array
+            scale: Vertical scale factor
+            dtype: Vertex component type (np.float32 for GPU buffers)
+
+        Returns:
+            (rows * cols, 3) array of vertex positions
+        """
+        rows, cols = heightmap.shape
+
+        # Fill a preallocated buffer through a (rows, cols, 3) view
+        vertices = np.empty((rows * cols, 3), dtype=dtype)
+        grid = vertices.reshape(rows, cols, 3)
+        grid[:, :, 0] = np.arange(cols)
+        np.multiply(heightmap, scale, out=grid[:, :, 1])
+        grid[:, :, 2] = np.arange(rows)[:, np.newaxis]
+
+        return vertices
+
+    def _grid_indices(self, rows: int, cols: int) -> np.ndarray:
+        """
+        Build triangle indices for a rows x cols vertex grid.
+
+        Args:
+            rows: Number of vertex rows
+            cols: Number of vertex columns
+
+        Returns:
+            Flat index array (uint16 when every vertex fits, else uint32),
+            two triangles (six indices) per quad, with quads emitted in Z-order so neighbouring triangles share
+            recently transformed vertices
+        """
+        quad_rows, quad_cols = np.unravel_index(self._morton_order(rows - 1, cols - 1), (rows - 1, cols - 1))
+        base = quad_rows.astype(np.uint32) * np.uint32(cols) + quad_cols.astype(np.uint32)
+
+        # Fill a preallocated buffer, one corner of each quad at a time
+        index_dtype = np.uint16 if rows * cols <= 65536 else np.uint32
+        indices = np.empty((base.size, 6), dtype=index_dtype)
+        indices[:, 0] = base
+        indices[:, 1] = base + 1
+        indices[:, 2] = base + cols
+        indices[:, 3] = indices[:, 2]
+        indices[:, 4] = indices[:, 1]
+        indices[:, 5] = base + (cols + 1)
+
+        return indices.reshape(-1)
+
+    @staticmethod
+    def _morton_order(rows: int, cols: int) -> np.ndarray:
+        """
+        Order the cells of a rows x cols grid along a Z-order (Morton) curve.
+
+        Args:
+            rows: Number of grid rows
+            cols: Number of grid columns
+
+        Returns:
+            Row-major flat cell indices sorted by Morton code
+        """
+        def spread_bits(values: np.ndarray) -> np.ndarray:
+            # Insert a zero bit between each of the low 16 bits
+            values = values.astype(np.uint32)
+            values = (values | (values << 8)) & 0x00FF00FF
+            values = (values | (values << 4)) & 0x0F0F0F0F
+            values = (values | (values << 2)) & 0x33333333
+            values = (values | (values << 1)) & 0x55555555
+            return values
+
+        codes = (spread_bits(np.arange(rows))[:, np.newaxis] << 1) | spread_bits(np.arange(cols))[np.newaxis, :]
+        return np.argsort(codes, axis=None, kind='stable')
+
+    def _get_height_colors(self, heights: np.ndarray) -> np.ndarray:
+        """
+        Get colors for an array of normalized heights (0-1).
+
+        Args:
+            heights: Normalized heights
+
+        Returns:
+            (N, 3) array of colors
+        """
+        return self._HEIGHT_PALETTE[np.searchsorted(self._HEIGHT_THRESHOLDS, heights, side='right')]
+
     def _get_height_color(self, height: float) -> List[float]:
         """Get color based on normalized height (0-1)."""
-        # Water
-        if height < 0.1:
-            return [0, 0.4, 0.8]
-        # Sand
-        elif height < 0.2:
-            return [0.9, 0.8, 0.6]
-        # Grass
-        elif height < 0.5:
-            return [0.2, 0.6, 0.2]
-        # Forest
-        elif height < 0.7:
-            return [0.1, 0.4, 0.1]
-        # Mountain
-        elif height < 0.9:
-            return [0.5, 0.5, 0.5]
-        # Snow
-        else:
-            return [0.9, 0.9, 0.9]
+        return self._get_height_colors(height).tolist()
 
     def generate_biome_mesh_data(self, heightmap: np.ndarray, biome_grid: np.ndarray) -> Dict:
         """
@@ -101,33 +232,19 @@ class TerrainMeshGenerator:
             Dictionary with biome-colored mesh data
         """
         rows, cols = heightmap.shape
-        vertices = []
-        colors = []
-        indices = []
-
         biome_color_map = self._get_biome_color_map()
 
-        # Generate vertices and biome-based colors
-        for z in range(rows):
-            for x in range(cols):
-                y = heightmap[z, x] * 5  # Scale for visualization
-                vertices.extend([x, y, z])
-
-                biome = biome_grid[z, x]
-                color = biome_color_map.get(biome, [0.5, 0.5, 0.5])
-                colors.extend(color)
-
-        # Generate indices (same as regular mesh)
-        for z in range(rows - 1):
-            for x in range(cols - 1):
-                indices.extend([
-                    z * cols + x,
-                    z * cols + x + 1,
-                    (z + 1) * cols + x,
-                    (z + 1) * cols + x,
-                    z * cols + x + 1,
-                    (z + 1) * cols + x + 1
-                ])
+        # Scale heights for visualization
+        vertices = self._grid_vertices(heightmap, 5).ravel().tolist()
+
+        # Biome-based colors, looked up once per distinct biome
+        default_row = len(self._BIOME_PALETTE) - 1
+        biome_names, biome_index = np.unique(biome_grid, return_inverse=True)
+        palette_rows = [self._BIOME_PALETTE_INDEX.get(biome, default_row) for biome in biome_names]
+        colors = self._BIOME_PALETTE[palette_rows][biome_index.ravel()].ravel().tolist()
+
+        # Same triangle layout as the regular mesh
+        indices = self._grid_indices(rows, cols).tolist()
 
         return {
             'vertices': vertices,
@@ -139,29 +256,26 @@ class TerrainMeshGenerator:
         }
 
     def _get_biome_color_map(self) -> Dict[str, List[float]]:
-        """Get color mapping for different biomes."""
-        return {
-            'ocean': [0.0, 0.4, 0.8],
-            'beach': [0.9, 0.8, 0.6],
-            'swamp': [0.3, 0.5, 0.2],
-            'forest': [0.1, 0.4, 0.1],
-            'jungle': [0.1, 0.5, 0.1],
-            'grassland': [0.4, 0.6, 0.3],
-            'plains': [0.6, 0.7, 0.4],
-            'desert': [0.8, 0.7, 0.5],
-            'hills': [0.5, 0.4, 0.3],
-            'mountain': [0.5, 0.5, 0.5],
-            'snow': [0.9, 0.9, 0.9],
-            'tundra': [0.7, 0.8, 0.9]
-        }
+        """Get color mapping for different biomes (shared; do not modify)."""
+        return self._BIOME_COLOR_MAP
 
-    def generate_simplified_mesh(self, heightmap: np.ndarray, simplification: int = 2) -> Dict:
+    def generate_simplified_mesh(self, heightmap: np.ndarray, simplification: int = 2,
+                                 max_error: Optional[float] = None) -> Dict:
         """
         Generate simplified mesh data for performance.
 
+        By default the heightmap is decimated on a uniform stride. When
+        max_error is given, an adaptive triangulated irregular network is
+        built instead, spending at most the same vertex budget where the
+        terrain is hardest to approximate so peaks and ridges survive and
+        flat areas use few triangles.
+
         Args:
             heightmap: Original heightmap
             simplification: Simplification factor (higher = fewer vertices)
+            max_error: Vertical error tolerance for an adaptive mesh
+                (requires scipy); heightmaps a single row or column wide
+                use the uniform stride instead
 
         Returns:
             Simplified mesh data
@@ -169,26 +283,169 @@ class TerrainMeshGenerator:
         if simplification < 1:
             simplification = 1
 
+        # A single row or column has no non-collinear points to triangulate;
+        # with two or more of each, the four corners always do
+        if max_error is not None and min(heightmap.shape) >= 2:
+            return self._generate_adaptive_mesh(heightmap, simplification, max_error)
+
         # Downsample heightmap
         simplified_heightmap = heightmap[::simplification, ::simplification]
 
         return self.generate_mesh_data(simplified_heightmap)
 
-    def save_mesh_to_json(self, mesh_data: Dict, filename: str):
+    def _generate_adaptive_mesh(self, heightmap: np.ndarray, simplification: int, max_error: float) -> Dict:
+        """
+        Build an error-driven Delaunay mesh of the heightmap.
+
+        Starting from the border and a coarse seed grid, each round inserts
+        the worst-approximated heightmap sample of the worst triangles until
+        every sample is within max_error or the vertex budget is spent.
+
+        Args:
+            heightmap: Original heightmap
+            simplification: Stride whose vertex count sets the point budget
+            max_error: Vertical error at which refinement stops
+
+        Returns:
+            Mesh data with vertices, colors and indices of the irregular mesh
+        """
+        from scipy.spatial import Delaunay
+
+        rows, cols = heightmap.shape
+        budget = len(range(0, rows, simplification)) * len(range(0, cols, simplification))
+
+        # Always keep the border ring and a coarse seed grid
+        keep = np.zeros((rows, cols), dtype=bool)
+        keep[::simplification * 2, ::simplification * 2] = True
+        keep[[0, -1], ::simplification] = True
+        keep[::simplification, [0, -1]] = True
+        keep[[0, 0, -1, -1], [0, -1, 0, -1]] = True
+
+        grid_z, grid_x = np.mgrid[0:rows, 0:cols]
+        samples = np.column_stack((grid_x.ravel(), grid_z.ravel())).astype(np.float64)
+        heights = heightmap.ravel()
+
+        while True:
+            zs, xs = np.nonzero(keep)
+            triangulation = Delaunay(np.column_stack((xs, zs)))
+
+            # Interpolate every sample from its triangle's corners
+            simplex = triangulation.find_simplex(samples)
+            transform = triangulation.transform[simplex]
+            weights = np.einsum('ijk,ik->ij', transform[:, :2], samples - transform[:, 2])
+            weights = np.column_stack((weights, 1.0 - weights.sum(axis=1)))
+            corner_heights = heightmap[zs, xs][triangulation.simplices[simplex]]
+            error = np.abs((weights * corner_heights).sum(axis=1) - heights)
+            error[keep.ravel()] = 0.0
+
+            remaining = budget - int(keep.sum())
+            if remaining <= 0 or error.max() <= max_error:
+                break
+
+            # Worst sample per triangle, then the worse half of those
+            by_error = np.argsort(-error, kind='stable')
+            _, first = np.unique(simplex[by_error], return_index=True)
+            candidates = by_error[first]
+            candidates = candidates[error[candidates] > max_error]
+            candidates = candidates[np.argsort(-error[candidates], kind='stable')]
+            keep.flat[candidates[:min(remaining, (candidates.size + 1) // 2)]] = True
+
+        triangles = triangulation.simplices.copy()
+
+        # Match the winding of the regular grid mesh
+        tri_x, tri_z = xs[triangles].T, zs[triangles].T
+        flipped = (tri_x[1] - tri_x[0]) * (tri_z[2] - tri_z[0]) - (tri_z[1] - tri_z[0]) * (tri_x[2] - tri_x[0]) < 0
+        triangles[flipped] = triangles[flipped][:, ::-1]
+
+        vertex_heights = heightmap[zs, xs]
+        vertices = np.empty((xs.size, 3))
+        vertices[:, 0] = xs
+        vertices[:, 1] = vertex_heights
+        vertices[:, 2] = zs
+
+        index_dtype = np.uint16 if xs.size <= 65536 else np.uint32
+
+        return {
+            'vertices': vertices.ravel().tolist(),
+            'colors': self._get_height_colors(vertex_heights).ravel().tolist(),
+            'indices': triangles.astype(index_dtype).ravel().tolist(),
+            'width': cols,
+            'height': rows,
+            'scale': 1.0
+        }
+
+    def save_mesh_to_json(self, mesh_data: Dict, filename: str, binary: bool = False, sidecar: bool = False,
+                          quantize: bool = False):
         """
         Save mesh data to JSON file.
 
         Args:
             mesh_data: Mesh data dictionary
             filename: Output filename
+            binary: Store array fields as base64 float32/uint16/uint32 bytes
+                inside the JSON wrapper instead of number lists
+            sidecar: Write the array bytes to a .bin file next to the JSON
+                (glTF-style) instead of inlining them; implies binary
+            quantize: Store vertex positions as normalized uint16 with a
+                per-axis min/max, as in KHR_mesh_quantization; implies binary
         """
+        if not (binary or sidecar or quantize):
+            with open(filename, 'w') as f:
+                json.dump(mesh_data, f, indent=2)
+            return
+
+        mesh_data = dict(mesh_data)
+        chunks = []
+        offset = 0
+
+        for field in (*self._BINARY_FIELD_DTYPES, 'indices'):
+            if field not in mesh_data:
+                continue
+
+            header = {}
+            if quantize and field == 'vertices':
+                array, pos_min, pos_max = self._quantize_positions(mesh_data[field])
+                header = {'min': pos_min.tolist(), 'max': pos_max.tolist()}
+            else:
+                array = self._binary_array(field, mesh_data[field])
+
+            if not sidecar:
+                mesh_data[field] = {
+                    'dtype': array.dtype.str,
+                    'data': base64.b64encode(array.tobytes()).decode('ascii'),
+                    **header
+                }
+                continue
+
+            # Keep every view 4-byte aligned, as glTF requires
+            padding = -offset % 4
+            chunks.append(b'\0' * padding + array.tobytes())
+            offset += padding
+            mesh_data[field] = {
+                'dtype': array.dtype.str,
+                'byteOffset': offset,
+                'count': array.size,
+                **header
+            }
+            offset += array.nbytes
+
+        if sidecar:
+            bin_filename = os.path.splitext(filename)[0] + '.bin'
+            with open(bin_filename, 'wb') as f:
+                f.write(b''.join(chunks))
+            mesh_data['binary_uri'] = os.path.basename(bin_filename)
+
         with open(filename, 'w') as f:
-            json.dump(mesh_data, f, indent=2)
+            json.dump(mesh_data, f, separators=(',', ':'))
 
     def load_mesh_from_json(self, filename: str) -> Dict:
         """
         Load mesh data from JSON file.
 
+        Binary array fields written by save_mesh_to_json(binary=True) or
+        save_mesh_to_json(sidecar=True) are decoded back into numpy arrays,
+        and quantized positions are expanded back to float32.
+
         Args:
             filename: Input filename
 
@@ -196,7 +453,73 @@ class TerrainMeshGenerator:
             Loaded mesh data
         """
         with open(filename, 'r') as f:
-            return json.load(f)
+            mesh_data = json.load(f)
+
+        blob = None
+        if 'binary_uri' in mesh_data:
+            bin_filename = os.path.join(os.path.dirname(filename), mesh_data.pop('binary_uri'))
+            with open(bin_filename, 'rb') as f:
+                blob = f.read()
+
+        for field, value in mesh_data.items():
+            if not (isinstance(value, dict) and 'dtype' in value):
+                continue
+            if 'data' in value:
+                mesh_data[field] = np.frombuffer(base64.b64decode(value['data']), dtype=value['dtype'])
+            elif 'byteOffset' in value and blob is not None:
+                mesh_data[field] = np.frombuffer(blob, dtype=value['dtype'], count=value['count'],
+                                                 offset=value['byteOffset'])
+            else:
+                continue
+
+            if 'min' in value:
+                pos_min = np.array(value['min'], dtype=np.float32)
+                extent = np.array(value['max'], dtype=np.float32) - pos_min
+                positions = mesh_data[field].reshape(-1, 3) * (extent / np.float32(65535)) + pos_min
+                mesh_data[field] = positions.astype(np.float32).ravel()
+
+        return mesh_data
+
+    def _quantize_positions(self, vertices) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Quantize [x, y, z] positions to normalized uint16 per axis.
+
+        Args:
+            vertices: Flat list or array of vertex positions
+
+        Returns:
+            Tuple of (flat uint16 array, per-axis minimum, per-axis maximum)
+        """
+        positions = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        if positions.size == 0:
+            return np.empty(0, dtype=np.uint16), np.zeros(3), np.zeros(3)
+
+        pos_min = positions.min(axis=0)
+        pos_max = positions.max(axis=0)
+        extent = pos_max - pos_min
+        extent[extent == 0] = 1.0
+
+        quantized = np.rint((positions - pos_min) / extent * 65535).astype(np.uint16)
+        return quantized.ravel(), pos_min, pos_max
+
+    def _binary_array(self, field: str, values) -> np.ndarray:
+        """
+        Convert a mesh array field to its compact binary dtype.
+
+        Args:
+            field: Mesh data field name
+            values: Array or list of numbers
+
+        Returns:
+            Flat contiguous float32, uint16 or uint32 array
+        """
+        if field == 'indices':
+            values = np.asarray(values)
+            dtype = np.uint16 if values.size == 0 or values.max() < 65536 else np.uint32
+        else:
+            dtype = self._BINARY_FIELD_DTYPES[field]
+
+        return np.ascontiguousarray(values, dtype=dtype).ravel()
 
     def generate_poi_positions(self, biome_grid: np.ndarray, poi_density: float = 0.01) -> List[Tuple[int, int, str]]:
         """
@@ -213,43 +536,20 @@ class TerrainMeshGenerator:
         total_cells = rows * cols
         target_pois = int(total_cells * poi_density)
 
-        # Biome weights for POI likelihood
-        biome_weights = {
-            'ocean': 0.1,    # Few POIs in deep ocean
-            'beach': 0.5,    # Good for ports, shipwrecks
-            'swamp': 0.8,    # Great for ruins, hidden places
-            'forest': 0.9,   # Excellent for settlements, temples
-            'jungle': 1.0,   # Best for ancient ruins
-            'grassland': 0.7,
-            'plains': 0.6,
-            'desert': 0.7,   # Good for oases, ruins
-            'hills': 0.8,    # Good for watchtowers, mines
-            'mountain': 0.4, # Some mountain passes, caves
-            'snow': 0.2,     # Few snow POIs
-            'tundra': 0.3
-        }
-
-        # Create weight grid
-        weight_grid = np.zeros((rows, cols))
-        for y in range(rows):
-            for x in range(cols):
-                biome = biome_grid[y, x]
-                weight_grid[y, x] = biome_weights.get(biome, 0.5)
-
-        # Normalize weights
-        weight_grid = weight_grid / weight_grid.sum()
+        # Weight each cell by its biome's POI likelihood
+        biome_names, biome_index = np.unique(biome_grid, return_inverse=True)
+        weight_lut = np.array([self._POI_BIOME_WEIGHTS.get(biome, 0.5) for biome in biome_names])
+        weights = weight_lut[biome_index.ravel()]
 
-        # Sample positions
-        positions = []
-        for _ in range(target_pois):
-            # Find random position based on weights
-            flat_weights = weight_grid.flatten()
-            idx = np.random.choice(len(flat_weights), p=flat_weights)
+        # Normalize weights in place on the flat buffer
+        weights /= weights.sum()
 
-            y, x = np.unravel_index(idx, weight_grid.shape)
-            biome = biome_grid[y, x]
+        # Sample all positions in one draw
+        flat_indices = self.rng.choice(total_cells, size=target_pois, p=weights)
+        ys, xs = np.unravel_index(flat_indices, (rows, cols))
+        biomes = biome_grid[ys, xs]
 
-            positions.append((x, y, biome))
+        positions = list(zip(xs.tolist(), ys.tolist(), biomes.tolist()))
 
         return positions
 
@@ -5,13 +5,126 @@ Multi-octave Perlin noise implementation for procedural terrain generation.
 """
 
 import random
-import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import List, Tuple, Dict, Any
 
+# Array kernels behind every PerlinNoise entry point; scalars are evaluated
+# as 0-d arrays so single samples and whole grids share one code path.
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Fade function for smooth interpolation."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation."""
+    return a + t * (b - a)
+
+def _grad(hash: np.ndarray, x: np.ndarray, y: np.ndarray, z: float) -> np.ndarray:
+    """Gradient function."""
+    h = hash & 15
+    u = np.where(h < 8, x, y)
+    v = np.where(h < 4, y, np.where((h == 12) | (h == 14), x, z))
+    return np.where((h & 1) == 0, u, -u) + np.where((h & 2) == 0, v, -v)
+
+def _noise2d_grid(permutation: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Generate 2D Perlin noise for arrays of coordinates.
+
+    Args:
+        permutation: Doubled uint8 permutation table (512 entries)
+        x: X coordinates
+        y: Y coordinates
+
+    Returns:
+        Noise values with the shape of x and y
+    """
+    # Find unit grid cell containing each point
+    x_int = np.trunc(x)
+    y_int = np.trunc(y)
+    X = x_int.astype(np.int64) & 255
+    Y = y_int.astype(np.int64) & 255
+
+    # Get relative xy coordinates of points within their cells
+    x = x - x_int
+    y = y - y_int
+
+    # Compute fade curves for each of x, y
+    u = _fade(x)
+    v = _fade(y)
+
+    # Hash coordinates of the 4 cube corners; Y is int64, so the sums
+    # can't wrap around in uint8
+    A = np.take(permutation, X) + Y
+    AA = np.take(permutation, A)
+    AB = np.take(permutation, A + 1)
+    B = np.take(permutation, X + 1) + Y
+    BA = np.take(permutation, B)
+    BB = np.take(permutation, B + 1)
+
+    # Blend results from 4 corners of cube
+    return _lerp(
+        _lerp(_grad(np.take(permutation, AA), x, y, 0.0),
+              _grad(np.take(permutation, BA), x - 1, y, 0.0), u),
+        _lerp(_grad(np.take(permutation, AB), x, y - 1, 0.0),
+              _grad(np.take(permutation, BB), x - 1, y - 1, 0.0), u),
+        v
+    )
+
+def _octave_table(octaves: int, persistence: float, lacunarity: float) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Precompute per-octave frequencies and amplitudes.
+
+    Built by repeated multiplication, like the original octave loop, so
+    the values match it exactly.
+
+    Args:
+        octaves: Number of octaves
+        persistence: Amplitude reduction per octave
+        lacunarity: Frequency increase per octave
+
+    Returns:
+        Tuple of (frequencies, amplitudes, sum of amplitudes)
+    """
+    frequencies = np.cumprod([1.0] + [lacunarity] * (octaves - 1))[:octaves]
+    amplitudes = np.cumprod([1.0] + [persistence] * (octaves - 1))[:octaves]
+    max_value = 0.0
+    for amplitude in amplitudes:
+        max_value += amplitude
+
+    return frequencies, amplitudes, max_value
+
+def _fbm_grid(permutation: np.ndarray, x: np.ndarray, y: np.ndarray,
+              frequencies: np.ndarray, amplitudes: np.ndarray, max_value: float) -> np.ndarray:
+    """
+    Generate fractional Brownian motion noise for arrays of coordinates.
+
+    Args:
+        permutation: Doubled permutation table
+        x: X coordinates
+        y: Y coordinates
+        frequencies: Per-octave frequencies
+        amplitudes: Per-octave amplitudes
+        max_value: Sum of amplitudes
+
+    Returns:
+        Noise values in range [-1, 1]
+    """
+    total = np.zeros(np.shape(x))
+
+    for frequency, amplitude in zip(frequencies, amplitudes):
+        total += _noise2d_grid(permutation, x * frequency, y * frequency) * amplitude
+
+    # Normalize to [-1, 1] range
+    total /= max_value
+    return total
+
 class PerlinNoise:
     """
-    Pure Python implementation of Perlin noise with multi-octave support.
+    Perlin noise with multi-octave support.
+
+    Point queries and whole heightmaps are both evaluated with the module's
+    array kernels.
     """
 
     def __init__(self, seed: int = None, octaves: int = 6, persistence: float = 0.5, lacunarity: float = 2.0):
@@ -32,85 +145,48 @@ class PerlinNoise:
         # Initialize permutation table
         self.permutation = self._initialize_permutation()
 
-    def _initialize_permutation(self) -> List[int]:
+        # Octave frequencies/amplitudes, rebuilt if the settings change
+        self._octave_key = None
+        self._octave_cache = None
+
+    def _initialize_permutation(self) -> np.ndarray:
         """Initialize permutation table with seed."""
-        random.seed(self.seed)
-        permutation = list(range(256))
-        random.shuffle(permutation)
-        return permutation * 2
-
-    def _fade(self, t: float) -> float:
-        """Fade function for smooth interpolation."""
-        return t * t * t * (t * (t * 6 - 15) + 10)
-
-    def _lerp(self, a: float, b: float, t: float) -> float:
-        """Linear interpolation."""
-        return a + t * (b - a)
-
-    def _grad(self, hash: int, x: float, y: float, z: float) -> float:
-        """Gradient function."""
-        h = hash & 15
-        u = x if h < 8 else y
-        v = y if h < 4 else (x if h == 12 or h == 14 else z)
-        return (u if (h & 1) == 0 else -u) + (v if (h & 2) == 0 else -v)
-
-    def _noise2d(self, x: float, y: float) -> float:
-        """Generate 2D Perlin noise at given coordinates."""
-        # Find unit grid cell containing point
-        X = int(x) & 255
-        Y = int(y) & 255
-
-        # Get relative xy coordinates of point within that cell
-        x -= int(x)
-        y -= int(y)
-
-        # Compute fade curves for each of x, y
-        u = self._fade(x)
-        v = self._fade(y)
-
-        # Hash coordinates of the 4 cube corners
-        A = self.permutation[X] + Y
-        AA = self.permutation[A]
-        AB = self.permutation[A + 1]
-        B = self.permutation[X + 1] + Y
-        BA = self.permutation[B]
-        BB = self.permutation[B + 1]
-
-        # Blend results from 4 corners of cube
-        return self._lerp(
-            self._lerp(self._grad(self.permutation[AA], x, y, 0),
-                      self._grad(self.permutation[BA], x - 1, y, 0), u),
-            self._lerp(self._grad(self.permutation[AB], x, y - 1, 0),
-                      self._grad(self.permutation[BB], x - 1, y - 1, 0), u),
-            v
-        )
-
-    def noise(self, x: float, y: float) -> float:
+        permutation = np.random.default_rng(self.seed).permutation(256).astype(np.uint8)
+        return np.concatenate((permutation, permutation))
+
+    def noise(self, x, y):
         """
         Generate fractional Brownian motion noise at given coordinates.
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            x: X coordinate, or array of X coordinates
+            y: Y coordinate, or array of Y coordinates
 
         Returns:
-            Noise value in range [-1, 1]
+            Noise value in range [-1, 1] (an array when given arrays)
         """
-        total = 0.0
-        frequency = 1.0
-        amplitude = 1.0
-        max_value = 0.0
-
-        for _ in range(self.octaves):
-            total += self._noise2d(x * frequency, y * frequency) * amplitude
-            max_value += amplitude
-            frequency *= self.lacunarity
-            amplitude *= self.persistence
+        total = _fbm_grid(self.permutation, x, y, *self._get_octave_table())
+        return float(total) if total.ndim == 0 else total
+
+    def _get_octave_table(self) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Get cached octave frequencies/amplitudes for the current settings."""
+        key = (self.octaves, self.persistence, self.lacunarity)
+        if self._octave_key != key:
+            self._octave_key = key
+            self._octave_cache = _octave_table(*key)
+        return self._octave_cache
+
+    def reseed(self, seed: int):
+        """
+        Re-seed the generator and rebuild the permutation table.
 
-        # Normalize to [-1, 1] range
-        return total / max_value
+        Args:
+            seed: New random seed
+        """
+        self.seed = seed
+        self.permutation = self._initialize_permutation()
 
-    def generate_heightmap(self, width: int, height: int, scale: float = 50.0) -> np.ndarray:
+    def generate_heightmap(self, width: int, height: int, scale: float = 50.0, seed: int = None) -> np.ndarray:
         """
         Generate a 2D heightmap using Perlin noise.
 
@@ -118,25 +194,65 @@ class PerlinNoise:
             width: Width of heightmap
             height: Height of heightmap
             scale: Noise scale factor
+            seed: Optional seed; re-seeds the generator when it differs from the current one
 
         Returns:
             2D numpy array of height values
         """
-        heightmap = np.zeros((height, width))
+        if seed is not None and seed != self.seed:
+            self.reseed(seed)
 
-        for y in range(height):
-            for x in range(width):
-                # Scale coordinates to get more interesting features
-                nx = x / width * scale
-                ny = y / height * scale
+        # Scale coordinates to get more interesting features
+        nx = np.arange(width) / width * scale
+        ny = np.arange(height) / height * scale
+        x_grid, y_grid = np.meshgrid(nx, ny)
 
-                # Get noise value and normalize to [0, 1]
-                noise_val = (self.noise(nx, ny) + 1) / 2
-                heightmap[y, x] = noise_val
+        # Get noise values for the whole grid and normalize to [0, 1]
+        noise_vals = _fbm_grid(self.permutation, x_grid, y_grid, *self._get_octave_table())
+        heightmap = (noise_vals + 1) / 2
 
         return heightmap
 
-    def generate_island_heightmap(self, width: int, height: int, island_factor: float = 2.0) -> np.ndarray:
+    def generate_heightmap_tiled(self, width: int, height: int, scale: float = 50.0, seed: int = None,
+                                 tile: int = 128, n_jobs: int = None) -> np.ndarray:
+        """
+        Generate a 2D heightmap in horizontal stripes on a thread pool.
+
+        Noise depends only on absolute coordinates, so every stripe is
+        independent and the result matches generate_heightmap exactly. The
+        numpy kernels release the GIL, which lets stripes run concurrently.
+
+        Args:
+            width: Width of heightmap
+            height: Height of heightmap
+            scale: Noise scale factor
+            seed: Optional seed; re-seeds the generator when it differs from the current one
+            tile: Number of rows per stripe
+            n_jobs: Worker threads (defaults to the CPU count)
+
+        Returns:
+            2D numpy array of height values
+        """
+        if seed is not None and seed != self.seed:
+            self.reseed(seed)
+
+        nx = np.arange(width) / width * scale
+        ny = np.arange(height) / height * scale
+        octave_table = self._get_octave_table()
+        heightmap = np.empty((height, width))
+
+        def fill_stripe(y0: int):
+            y1 = min(y0 + tile, height)
+            x_grid, y_grid = np.meshgrid(nx, ny[y0:y1])
+            stripe = _fbm_grid(self.permutation, x_grid, y_grid, *octave_table)
+            heightmap[y0:y1] = (stripe + 1) / 2
+
+        with ThreadPoolExecutor(max_workers=n_jobs or os.cpu_count()) as executor:
+            list(executor.map(fill_stripe, range(0, height, tile)))
+
+        return heightmap
+
+    def generate_island_heightmap(self, width: int, height: int, island_factor: float = 2.0, seed: int = None) -> np.ndarray:
         """
         Generate an island-shaped heightmap.
 
@@ -144,25 +260,24 @@ class PerlinNoise:
             width: Width of heightmap
             height: Height of heightmap
             island_factor: Controls how "island-like" the terrain is
+            seed: Optional seed passed through to generate_heightmap
 
         Returns:
             2D numpy array of height values
         """
-        heightmap = self.generate_heightmap(width, height)
+        heightmap = self.generate_heightmap(width, height, seed=seed)
 
         # Create island effect by reducing height based on distance from center
         center_x, center_y = width / 2, height / 2
 
-        for y in range(height):
-            for x in range(width):
-                # Calculate distance from center (normalized)
-                dx = (x - center_x) / width
-                dy = (y - center_y) / height
-                distance = math.sqrt(dx*dx + dy*dy)
+        # Calculate distance from center (normalized) for the whole grid
+        dx = (np.arange(width) - center_x) / width
+        dy = (np.arange(height) - center_y) / height
+        distance = np.sqrt((dx * dx)[np.newaxis, :] + (dy * dy)[:, np.newaxis])
 
-                # Apply island falloff
-                falloff = 1.0 - distance ** island_factor
-                heightmap[y, x] = heightmap[y, x] * max(falloff, 0.1)
+        # Apply island falloff
+        falloff = 1.0 - distance ** island_factor
+        heightmap *= np.maximum(falloff, 0.1)
 
         return heightmap
 
@@ -197,24 +312,26 @@ def apply_erosion(heightmap: np.ndarray, iterations: int = 3, radius: int = 1) -
         Eroded heightmap
     """
     eroded = heightmap.copy()
+    rows, cols = heightmap.shape
+
+    # Grids with no cell a full radius from every edge have no interior
+    if radius < 1 or rows <= 2 * radius or cols <= 2 * radius:
+        return eroded
+
+    count = (2 * radius + 1) ** 2 - 1
+    interior = (slice(radius, rows - radius), slice(radius, cols - radius))
 
     for _ in range(iterations):
-        for y in range(radius, heightmap.shape[0] - radius):
-            for x in range(radius, heightmap.shape[1] - radius):
-                # Simple average of neighboring cells
-                total = 0
-                count = 0
-
-                for dy in range(-radius, radius + 1):
-                    for dx in range(-radius, radius + 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        total += heightmap[y + dy, x + dx]
-                        count += 1
-
-                if count > 0:
-                    average = total / count
-                    eroded[y, x] = (heightmap[y, x] + average) / 2
+        # Sum the neighbours of every interior cell with shifted views
+        total = np.zeros_like(eroded[interior])
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if dx == 0 and dy == 0:
+                    continue
+                total += eroded[radius + dy:rows - radius + dy, radius + dx:cols - radius + dx]
+
+        # Blend each cell with the average of its neighbours
+        eroded[interior] = (eroded[interior] + total / count) / 2
 
     return eroded
 
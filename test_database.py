@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Database persistence tests
+
+Covers POI storage across world saves.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from server.database import DatabaseManager
+
+
+def _run_with_database(tmp_path, steps):
+    """Run an async callback against a fresh database and close it afterwards"""
+    async def run():
+        database = DatabaseManager(str(tmp_path / "world.db"))
+        await database.initialize()
+        try:
+            return await steps(database)
+        finally:
+            await database.close()
+
+    return asyncio.run(run())
+
+
+async def _created_at(database, poi_id):
+    """Read the stored created_at of a POI row"""
+    cursor = await database.connection.cursor()
+    await cursor.execute("SELECT created_at FROM pois WHERE id = ?", (poi_id,))
+    return (await cursor.fetchone())[0]
+
+
+def test_world_pois_live_in_pois_table(tmp_path):
+    """A world's POIs round-trip through the pois table, not the world row"""
+    poi = {"id": "poi_1", "type": "town", "x": 3, "y": 4}
+
+    async def steps(database):
+        await database.save_world("world_1", {"id": "world_1", "pois": {"poi_1": poi}})
+        cursor = await database.connection.cursor()
+        await cursor.execute("SELECT data FROM worlds WHERE id = ?", ("world_1",))
+        return (await cursor.fetchone())[0], await database.load_world("world_1")
+
+    world_json, world_data = _run_with_database(tmp_path, steps)
+
+    assert "poi_1" not in world_json
+    assert world_data["pois"] == {"poi_1": poi}
+
+
+def test_poi_saved_after_world_is_loaded(tmp_path):
+    """POIs saved on their own show up when the world is reloaded"""
+    poi = {"id": "poi_2", "type": "ruin", "x": 1, "y": 1}
+
+    async def steps(database):
+        await database.save_world("world_1", {"id": "world_1", "pois": {}})
+        await database.save_poi("poi_2", "world_1", poi)
+        return await database.load_world("world_1")
+
+    assert _run_with_database(tmp_path, steps)["pois"] == {"poi_2": poi}
+
+
+def test_resave_keeps_poi_created_at(tmp_path):
+    """Saving a world again updates its POIs without resetting created_at"""
+    poi = {"id": "poi_1", "type": "town", "x": 3, "y": 4}
+
+    async def steps(database):
+        await database.save_world("world_1", {"id": "world_1", "pois": {"poi_1": poi}})
+        created_at = await _created_at(database, "poi_1")
+        await asyncio.sleep(0.01)
+        await database.save_world("world_1", {"id": "world_1", "pois": {"poi_1": dict(poi, name="Renamed")}})
+        return created_at, await _created_at(database, "poi_1"), await database.load_poi("poi_1")
+
+    created_at, resaved_created_at, reloaded = _run_with_database(tmp_path, steps)
+
+    assert resaved_created_at == created_at
+    assert reloaded["name"] == "Renamed"
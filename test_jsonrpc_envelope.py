@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+JSON-RPC 2.0 envelope tests for the MCP handler
+
+Covers Error -32600 scenarios, strict protocol compliance, end-to-end
+compliance of tool responses, parse errors and the validation layer.
+"""
+
+import json
+
+import pytest
+
+try:
+    import orjson
+
+    def jd(obj) -> str:
+        """Pretty-print a response for assertion messages."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+    def jb(obj) -> bytes:
+        """Serialize commands to the raw bytes the handler reads."""
+        return orjson.dumps(obj)
+except ImportError:
+    def jd(obj) -> str:
+        """Pretty-print a response for assertion messages."""
+        return json.dumps(obj, indent=2, default=str)
+
+    def jb(obj) -> bytes:
+        """Serialize commands to the raw bytes the handler reads."""
+        return json.dumps(obj).encode()
+
+# Test cases that should trigger Error -32600
+ERROR_32600_CASES = [
+    {
+        "name": "Missing 'tool' field",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "arguments": {}
+        }
+    },
+    {
+        "name": "Invalid command structure (not a dict)",
+        "command": "invalid_command_string"
+    },
+    {
+        "name": "Empty command",
+        "command": {}
+    },
+    {
+        "name": "Command with only invalid fields",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "random_field": "value",
+            "another_field": "data"
+        }
+    },
+    {
+        "name": "Command with wrong structure",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "get_diary",  # Should be 'tool', not 'method'
+            "params": {}  # Should be 'arguments', not 'params'
+        }
+    }
+]
+
+# Shared default for lookups into a missing error object
+_EMPTY = {}
+
+# Outcome of an Error -32600 case, keyed by the returned error code
+ERROR_32600_STATUS = {
+    -32600: "ok",
+    None: "success response"
+}
+
+# Test cases for strict protocol compliance
+STRICT_CASES = [
+    {
+        "name": "Valid JSON-RPC 2.0 command",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "should_pass": True
+    },
+    {
+        "name": "Command without jsonrpc field",
+        "command": {
+            "id": 2,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "should_pass": False  # Should fail validation
+    },
+    {
+        "name": "Command with wrong jsonrpc version",
+        "command": {
+            "jsonrpc": "1.0",
+            "id": 3,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "should_pass": False  # Should fail validation
+    },
+    {
+        "name": "Command with null id",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": None,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "should_pass": True  # Null id is allowed in JSON-RPC 2.0
+    },
+    {
+        "name": "Command with string id",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": "req1",
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "should_pass": True  # String ids are allowed in JSON-RPC 2.0
+    }
+]
+
+COMPLIANCE_CASES = [
+    {
+        "name": "Valid tool execution",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "expected_fields": ["jsonrpc", "id", "result"],
+        "should_have_result": True,
+        "should_have_error": False
+    },
+    {
+        "name": "Unknown tool",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "tool": "unknown_tool",
+            "arguments": {}
+        },
+        "expected_fields": ["jsonrpc", "id", "error"],
+        "should_have_result": False,
+        "should_have_error": True
+    },
+    {
+        "name": "Invalid command format",
+        "command": {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "invalid_field": "test"
+        },
+        "expected_fields": ["jsonrpc", "id", "error"],
+        "should_have_result": False,
+        "should_have_error": True
+    },
+    {
+        "name": "Command without jsonrpc field",
+        "command": {
+            "id": 4,
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "expected_fields": ["jsonrpc", "id", "error"],
+        "should_have_result": False,
+        "should_have_error": True
+    },
+    {
+        "name": "Command without id field",
+        "command": {
+            "jsonrpc": "2.0",
+            "tool": "get_diary",
+            "arguments": {}
+        },
+        "expected_fields": ["jsonrpc", "id", "result"],
+        "should_have_result": True,
+        "should_have_error": False
+    }
+]
+
+VALIDATION_CASES = [
+    {
+        "name": "Complete valid response",
+        "input": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"}
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"}
+        }
+    },
+    {
+        "name": "Missing jsonrpc field",
+        "input": {
+            "id": 1,
+            "result": {"status": "success"}
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"}
+        }
+    },
+    {
+        "name": "Missing id field",
+        "input": {
+            "jsonrpc": "2.0",
+            "result": {"status": "success"}
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": None,
+            "result": {"status": "success"}
+        }
+    },
+    {
+        "name": "Both result and error present",
+        "input": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"},
+            "error": {"code": -32600, "message": "error"}
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"}
+        }
+    },
+    {
+        "name": "Neither result nor error present",
+        "input": {
+            "jsonrpc": "2.0",
+            "id": 1
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"status": "success"}
+        }
+    },
+    {
+        "name": "Error only",
+        "input": {
+            "id": 1,
+            "error": {"code": -32601, "message": "Unknown tool"}
+        },
+        "expected": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -32601, "message": "Unknown tool"}
+        }
+    }
+]
+
+
+@pytest.fixture(scope="module")
+def error_32600_responses(handler):
+    """Responses to every Error -32600 case, sent as one serialized batch"""
+    return handler.handle_command_bytes(jb([case["command"] for case in ERROR_32600_CASES]))
+
+
+@pytest.fixture(scope="module")
+def strict_responses(handler):
+    """Responses to every strict compliance case, sent as one serialized batch"""
+    return handler.handle_command_bytes(jb([case["command"] for case in STRICT_CASES]))
+
+
+@pytest.fixture(scope="module")
+def compliance_responses(handler):
+    """Responses to every compliance case, sent as one serialized batch"""
+    return handler.handle_command_bytes(jb([case["command"] for case in COMPLIANCE_CASES]))
+
+
+@pytest.mark.parametrize("case", ERROR_32600_CASES, ids=lambda case: case["name"])
+def test_error_32600_scenarios(case, error_32600_responses):
+    """Test various scenarios that might trigger Error -32600"""
+    response = error_32600_responses[ERROR_32600_CASES.index(case)]
+
+    status = ERROR_32600_STATUS.get(response.get("error", _EMPTY).get("code"), "different error")
+    assert status == "ok", f"Expected Error -32600 but got {status}: {jd(response)}"
+
+
+@pytest.mark.parametrize("case", STRICT_CASES, ids=lambda case: case["name"])
+def test_jsonrpc_protocol_strict_compliance(case, strict_responses, validate_envelope):
+    """Test strict JSON-RPC 2.0 protocol compliance"""
+    response = strict_responses[STRICT_CASES.index(case)]
+
+    # Check if response is valid JSON-RPC 2.0
+    try:
+        validate_envelope(response)
+    except ValueError as e:
+        pytest.fail(f"Invalid JSON-RPC 2.0 response ({e}): {jd(response)}")
+
+    if case["should_pass"]:
+        assert "result" in response, f"Expected valid response but got: {jd(response)}"
+    else:
+        assert "error" in response, f"Expected rejection but got: {jd(response)}"
+
+
+@pytest.mark.parametrize("case", COMPLIANCE_CASES, ids=lambda case: case["name"])
+def test_jsonrpc_compliance_comprehensive(case, compliance_responses, validate_envelope):
+    """Test comprehensive JSON-RPC 2.0 compliance scenarios"""
+    response = compliance_responses[COMPLIANCE_CASES.index(case)]
+
+    # Validate the JSON-RPC envelope
+    try:
+        validate_envelope(response)
+    except ValueError as e:
+        pytest.fail(f"Invalid JSON-RPC 2.0 response ({e}): {jd(response)}")
+
+    # Check required fields
+    for field in case["expected_fields"]:
+        assert field in response, f"Missing required field: {field} in {jd(response)}"
+
+    # Check result/error structure
+    assert ("result" in response) == case["should_have_result"], f"Unexpected 'result' presence in {jd(response)}"
+    assert ("error" in response) == case["should_have_error"], f"Unexpected 'error' presence in {jd(response)}"
+    assert response["id"] == case["command"].get("id"), f"ID mismatch: expected {case['command'].get('id')}, got {response['id']}"
+
+    # Check result payload for successful tool calls
+    if case["should_have_result"]:
+        assert isinstance(response["result"], dict), f"'result' field should be a dictionary: {jd(response)}"
+        assert response["result"].get("type") == "success", f"'result' should contain 'type': 'success': {jd(response)}"
+
+
+@pytest.mark.parametrize("payload", [b'{"jsonrpc": "2.0", "id": 1, "tool":', b"\xff\xfe", b"not json"])
+def test_parse_error(payload, handler, validate_envelope):
+    """Test that malformed payloads get a JSON-RPC parse error"""
+    response = handler.handle_command_bytes(payload)
+
+    try:
+        validate_envelope(response)
+    except ValueError as e:
+        pytest.fail(f"Invalid JSON-RPC 2.0 response ({e}): {jd(response)}")
+    assert response["id"] is None, f"Parse error must have a null id: {jd(response)}"
+    assert response["error"]["code"] == -32700, f"Returned different error: {jd(response)}"
+
+
+@pytest.mark.parametrize("case", VALIDATION_CASES, ids=lambda case: case["name"])
+def test_protocol_validation_layer(case, handler):
+    """Test the protocol validation layer functionality"""
+    validated_response = handler.validate_jsonrpc_response(case["input"])
+
+    assert validated_response == case["expected"], f"Validation layer output differs from expected: {jd(validated_response)}"
+    assert validated_response is not case["input"], "validate_jsonrpc_response should build a new response"
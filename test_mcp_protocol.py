@@ -6,26 +6,135 @@ Comprehensive testing of MCP protocol communication, WebSocket broadcasting,
 database persistence, and complete workflow integration.
 """
 
+import itertools
 import json
+import queue
+import re
+import socket
 import sys
 import time
 import subprocess
 import threading
-import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 import websocket
 import sqlite3
 import os
+from urllib.parse import quote
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize an MCP command to a JSON line body."""
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+def _path(obj: Any, keys: tuple, default: Any = None) -> Any:
+    """
+    Look up a nested value without building empty dicts for missing levels.
+
+    Args:
+        obj: Decoded JSON object
+        keys: Keys to follow, outermost first
+        default: Value returned when any level is missing
+
+    Returns:
+        Nested value, or default
+    """
+    for key in keys:
+        obj = obj.get(key) if isinstance(obj, dict) else None
+        if obj is None:
+            return default
+    return obj
+
+def _tool_data(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the tool payload of a successful JSON-RPC response.
+
+    Tools report their own failures (missing parameters, unknown world) as
+    an "error" key inside an otherwise successful result.
+
+    Args:
+        response: Decoded JSON-RPC response
+
+    Returns:
+        The result's tool data, or None for errors of either kind
+    """
+    data = _path(response, ("result", "data"))
+    if not isinstance(data, dict) or "error" in data:
+        return None
+    return data
+
+def _error_message(response: Dict[str, Any]) -> str:
+    """
+    Describe why a JSON-RPC response is not a tool success.
+
+    Args:
+        response: Decoded JSON-RPC response, or an error dictionary from
+            send_mcp_batch
+
+    Returns:
+        Error message for the test log
+    """
+    error = response.get("error")
+    if isinstance(error, dict):
+        return error.get("message", "Unknown error")
+    if error:
+        return str(error)
+    return _path(response, ("result", "data", "error"), "Unknown error")
+
+# Port server/main.py tries first
+SERVER_DEFAULT_PORT = 8001
+
+# Longest time to wait for the server to report that it is listening
+SERVER_READY_TIMEOUT = 30.0
+
+# Longest time to wait for each MCP response
+MCP_RESPONSE_TIMEOUT = 10.0
+
+# Server pipe capacity, so large region and statistics payloads fit in one
+# write (Popen only accepts pipesize on Python 3.10+)
+MCP_PIPE_SIZE = 1 << 20
+
+# Pre-rendered JSON-RPC 2.0 command lines for the fixed-shape tools, filled
+# in with str.format and written as-is; world ids are UUIDs, so they need no
+# escaping
+_GET_REGION_TEMPLATE = '{{"jsonrpc":"2.0","id":{id},"tool":"get_region","arguments":{{"world_id":"{world_id}","x":{x},"y":{y}}}}}'
+_WORLD_TOOL_TEMPLATE = '{{"jsonrpc":"2.0","id":{id},"tool":"{tool}","arguments":{{"world_id":"{world_id}"}}}}'
+_INVALID_COMMAND_TEMPLATE = '{{"jsonrpc":"2.0","id":{id},"tool":"invalid_command","arguments":{{}}}}'
 
 class MCPProtocolTester:
     """Test MCP protocol communication and system integration."""
 
     def __init__(self):
         self.server_process = None
+        self.mcp_responses = queue.Queue()
+        self.server_ready = queue.Queue()
+        self.port = SERVER_DEFAULT_PORT
         self.websocket_connection = None
+        self.websocket_events = queue.Queue()
+        self.pending_events = []
         self.test_results = []
+        self.passed_tests = 0
         self.world_id = None
         self.events_received = []
+        self.event_types = set()
+        self._timestamp_second = None
+        self._timestamp_text = ""
+        self._request_ids = itertools.count(1)
 
     def log_result(self, test_name: str, success: bool, details: str = ""):
         """Log test result."""
@@ -33,44 +142,102 @@ class MCPProtocolTester:
             "test": test_name,
             "success": success,
             "details": details,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": self._timestamp()
         }
         self.test_results.append(result)
+        self.passed_tests += success
         status = "✅ PASS" if success else "❌ FAIL"
         print(f"{status} {test_name}")
         if details:
             print(f"    {details}")
 
+    def _timestamp(self) -> str:
+        """Current local time, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._timestamp_text
+
     def start_server(self):
         """Start the SPECTRE server."""
         print("🚀 Starting SPECTRE server...")
         try:
+            pipe_options = {"pipesize": MCP_PIPE_SIZE} if sys.version_info >= (3, 10) else {}
             self.server_process = subprocess.Popen(
                 [sys.executable, "server/main.py"],
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                **pipe_options
             )
 
+            # Collect MCP responses and drain the server log in the background
+            self.mcp_responses = queue.Queue()
+            self.server_ready = queue.Queue()
+            threading.Thread(target=self._stdout_pump, args=(self.server_process, self.mcp_responses), daemon=True).start()
+            threading.Thread(target=self._stderr_pump, args=(self.server_process, self.server_ready), daemon=True).start()
+
             # Wait for server to start
-            time.sleep(3)
+            if not self.wait_for_server():
+                self.log_result("Server Startup", False, "Server did not report it was listening")
+                self.stop_server()
+                return False
             return True
         except Exception as e:
             self.log_result("Server Startup", False, f"Failed to start server: {str(e)}")
             return False
 
+    def wait_for_server(self, timeout: float = SERVER_READY_TIMEOUT) -> bool:
+        """
+        Wait until uvicorn reports it is listening.
+
+        The server logs to stderr (stdout carries MCP); the stderr pump
+        reports the port from uvicorn's "Uvicorn running on" line, or None
+        if the server exits first.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True once the server is listening, False if it exited or timed out
+        """
+        try:
+            port = self.server_ready.get(timeout=timeout)
+        except queue.Empty:
+            return False
+
+        if port is None:
+            return False
+
+        self.port = port
+        return True
+
     def stop_server(self):
         """Stop the SPECTRE server."""
         if self.server_process:
             self.server_process.terminate()
-            self.server_process.wait(timeout=5)
+            try:
+                self.server_process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                # Executor threads blocked on the server's event queue can
+                # keep it alive after a graceful shutdown
+                self.server_process.kill()
+                self.server_process.wait()
             print("✅ Server stopped")
 
     def connect_websocket(self):
         """Connect to WebSocket server."""
         try:
-            ws_url = "ws://localhost:8000/ws"
-            self.websocket_connection = websocket.create_connection(ws_url)
+            ws_url = f"ws://localhost:{self.port}/ws"
+            # The reader thread receives while this thread may close, and
+            # orjson validates UTF-8 itself when it parses each event
+            self.websocket_connection = websocket.create_connection(
+                ws_url,
+                enable_multithread=True,
+                skip_utf8_validation=True
+            )
+            threading.Thread(target=self._websocket_reader, args=(self.websocket_connection,), daemon=True).start()
             self.log_result("WebSocket Connection", True, f"Connected to {ws_url}")
             return True
         except Exception as e:
@@ -79,61 +246,157 @@ class MCPProtocolTester:
 
     def disconnect_websocket(self):
         """Disconnect from WebSocket."""
-        if self.websocket_connection:
-            self.websocket_connection.close()
-            self.websocket_connection = None
+        connection, self.websocket_connection = self.websocket_connection, None
+        if connection:
+            connection.close()
 
-    def send_mcp_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
+    def send_mcp_command(self, command: Union[Dict[str, Any], str]) -> Dict[str, Any]:
         """Send MCP command via stdin."""
+        return self.send_mcp_batch([command])[0]
+
+    def send_mcp_batch(self, commands: List[Union[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """
+        Send several MCP commands via stdin in one write.
+
+        All commands are written and flushed together, then one response
+        line is read per command, so the batch costs a single round trip.
+
+        Args:
+            commands: MCP command dictionaries, or raw strings sent as-is
+                (pre-rendered command templates or malformed lines), one
+                per line
+
+        Returns:
+            Responses in command order
+        """
         if not self.server_process or not self.server_process.stdin:
-            return {"error": "Server process not available"}
+            return [{"error": "Server process not available"} for _ in commands]
 
         try:
-            # Send command via stdin
-            command_json = json.dumps(command)
-            self.server_process.stdin.write(command_json + "\n")
+            # Send all commands via stdin
+            self.server_process.stdin.write(b"".join(
+                (command.encode() if isinstance(command, str) else _dumps(command)) + b"\n" for command in commands
+            ))
             self.server_process.stdin.flush()
 
-            # Read response from stdout
-            response_line = self.server_process.stdout.readline().strip()
-            return json.loads(response_line)
+            # Collect one response per command from the stdout pump
+            return [self.mcp_responses.get(timeout=MCP_RESPONSE_TIMEOUT) for _ in commands]
 
+        except queue.Empty:
+            return [{"error": "MCP command failed: no response from server"} for _ in commands]
+        except Exception as e:
+            return [{"error": f"MCP command failed: {str(e)}"} for _ in commands]
+
+    @staticmethod
+    def _stderr_pump(server_process: subprocess.Popen, ready: queue.Queue):
+        """
+        Drain the server's stderr log so it can never fill the pipe.
+
+        The port from uvicorn's listening line is put on ready; None is put
+        instead if the log ends before that line appears.
+        """
+        port = None
+        for line in iter(server_process.stderr.readline, b""):
+            if port is None:
+                match = re.search(rb"Uvicorn running on http://[^:]+:(\d+)", line)
+                if match:
+                    port = int(match.group(1))
+                    ready.put(port)
+        if port is None:
+            ready.put(None)
+
+    @staticmethod
+    def _stdout_pump(server_process: subprocess.Popen, responses: queue.Queue):
+        """Decode MCP response lines from the server's stdout until it exits."""
+        # Lines are parsed as raw bytes with their newline; both parsers
+        # accept that, so there is no str decode or strip per response
+        for line in iter(server_process.stdout.readline, b""):
+            try:
+                responses.put(_loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                responses.put({"error": f"Invalid MCP response: {line.decode(errors='replace').strip()}"})
+
+    def _websocket_reader(self, connection: websocket.WebSocket):
+        """Receive WebSocket events until the connection closes."""
+        try:
+            while True:
+                # Parse frame payloads as bytes; recv() would decode them to str first
+                opcode, payload = connection.recv_data()
+                if opcode == websocket.ABNF.OPCODE_CLOSE:
+                    break
+                if payload:
+                    self.websocket_events.put(_loads(payload))
         except Exception as e:
-            return {"error": f"MCP command failed: {str(e)}"}
+            if connection is self.websocket_connection:
+                print(f"WebSocket error: {e}")
+
+    def _record_event(self, event_data: Dict[str, Any]):
+        """Add a received WebSocket event to the report tallies."""
+        self.events_received.append(event_data)
+        self.event_types.add(event_data.get("type"))
+        print(f"📡 WebSocket Event: {event_data.get('type', 'unknown')}")
 
     def listen_websocket_events(self, timeout: float = 5.0):
         """Listen for WebSocket events."""
         if not self.websocket_connection:
             return []
 
-        events = []
-        start_time = time.time()
+        # Start with events that wait_for_event set aside
+        events, self.pending_events = self.pending_events, []
+        deadline = time.monotonic() + timeout
 
         try:
-            while time.time() - start_time < timeout:
-                if self.websocket_connection.sock and self.websocket_connection.sock.gettimeout() is None:
-                    # Set a short timeout for the socket
-                    self.websocket_connection.sock.settimeout(0.1)
-
-                try:
-                    message = self.websocket_connection.recv()
-                    if message:
-                        event_data = json.loads(message)
-                        events.append(event_data)
-                        self.events_received.append(event_data)
-                        print(f"📡 WebSocket Event: {event_data.get('type', 'unknown')}")
-                except websocket.WebSocketTimeoutException:
-                    continue
-                except Exception as e:
-                    if "timed out" not in str(e).lower():
-                        print(f"WebSocket error: {e}")
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
 
-        except Exception as e:
-            print(f"Event listening error: {e}")
+                event_data = self.websocket_events.get(timeout=remaining)
+                events.append(event_data)
+                self._record_event(event_data)
+        except queue.Empty:
+            pass
 
         return events
 
+    def wait_for_event(self, event_type: str, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the first WebSocket event of a given type.
+
+        Returns as soon as a matching event arrives. Events of other types
+        received meanwhile are kept for later waits.
+
+        Args:
+            event_type: Event type to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Matching event, or None if none arrived in time
+        """
+        for index, event_data in enumerate(self.pending_events):
+            if event_data.get("type") == event_type:
+                return self.pending_events.pop(index)
+
+        if not self.websocket_connection:
+            return None
+
+        deadline = time.monotonic() + timeout
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+
+                event_data = self.websocket_events.get(timeout=remaining)
+                self._record_event(event_data)
+
+                if event_data.get("type") == event_type:
+                    return event_data
+                self.pending_events.append(event_data)
+        except queue.Empty:
+            return None
+
     def test_mcp_protocol_communication(self):
         """Test MCP protocol communication."""
         print("\n🧪 Testing MCP Protocol Communication...")
@@ -149,23 +412,26 @@ class MCPProtocolTester:
 
         # Test 3: Create world via MCP
         create_world_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "create_world",
             "arguments": {
                 "width": 64,
                 "height": 64,
-                "seed": "test_seed_123",
+                "seed": "123",
                 "island_mode": True
             }
         }
 
         response = self.send_mcp_command(create_world_cmd)
-        if "error" in response:
-            self.log_result("MCP Create World", False, f"Error: {response['error']}")
+        world_data = _tool_data(response)
+        if world_data is None:
+            self.log_result("MCP Create World", False, f"Error: {_error_message(response)}")
             self.stop_server()
             return False
 
-        if response.get("type") == "success":
-            self.world_id = response["result"]["world_id"]
+        if "world_id" in world_data:
+            self.world_id = world_data["world_id"]
             self.log_result("MCP Create World", True, f"World {self.world_id} created")
         else:
             self.log_result("MCP Create World", False, "Unexpected response format")
@@ -173,11 +439,10 @@ class MCPProtocolTester:
             return False
 
         # Test 4: Listen for WebSocket events
-        print("📡 Waiting for WebSocket events...")
-        events = self.listen_websocket_events(3.0)
+        print("📡 Waiting for world_created event...")
+        world_created_event = self.wait_for_event("world_created", 3.0)
 
         # Test 5: Verify world_created event was broadcast
-        world_created_event = next((e for e in events if e.get("type") == "world_created"), None)
         if world_created_event:
             self.log_result("WebSocket Event Broadcast", True, "world_created event received")
         else:
@@ -185,26 +450,12 @@ class MCPProtocolTester:
             self.stop_server()
             return False
 
-        # Test 6: Test region operations
-        region_cmd = {
-            "tool": "get_region",
-            "arguments": {
-                "world_id": self.world_id,
-                "x": 32,
-                "y": 32
-            }
-        }
+        # Tests 6-8: Region lookup, region naming and POI creation, sent as one batch
+        region_cmd = _GET_REGION_TEMPLATE.format(id=next(self._request_ids), world_id=self.world_id, x=32, y=32)
 
-        region_response = self.send_mcp_command(region_cmd)
-        if region_response.get("type") == "success":
-            self.log_result("MCP Get Region", True, "Region retrieved successfully")
-        else:
-            self.log_result("MCP Get Region", False, f"Failed: {region_response.get('error', 'Unknown error')}")
-            self.stop_server()
-            return False
-
-        # Test 7: Name a region
         name_region_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "name_region",
             "arguments": {
                 "world_id": self.world_id,
@@ -215,23 +466,9 @@ class MCPProtocolTester:
             }
         }
 
-        name_response = self.send_mcp_command(name_region_cmd)
-        if name_response.get("type") == "success":
-            self.log_result("MCP Name Region", True, "Region named successfully")
-
-            # Listen for region_named event
-            print("📡 Waiting for region_named event...")
-            events = self.listen_websocket_events(2.0)
-            region_named_event = next((e for e in events if e.get("type") == "region_named"), None)
-            if region_named_event:
-                self.log_result("Region Naming Event", True, f"Region named: {region_named_event.get('data', {}).get('name', 'unknown')}")
-            else:
-                self.log_result("Region Naming Event", False, "region_named event not received")
-        else:
-            self.log_result("MCP Name Region", False, f"Failed: {name_response.get('error', 'Unknown error')}")
-
-        # Test 8: Create POI
         poi_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "create_poi",
             "arguments": {
                 "world_id": self.world_id,
@@ -242,20 +479,43 @@ class MCPProtocolTester:
             }
         }
 
-        poi_response = self.send_mcp_command(poi_cmd)
-        if poi_response.get("type") == "success":
+        region_response, name_response, poi_response = self.send_mcp_batch([region_cmd, name_region_cmd, poi_cmd])
+
+        # Test 6: Test region operations
+        if _tool_data(region_response) is not None:
+            self.log_result("MCP Get Region", True, "Region retrieved successfully")
+        else:
+            self.log_result("MCP Get Region", False, f"Failed: {_error_message(region_response)}")
+            self.stop_server()
+            return False
+
+        # Test 7: Name a region
+        if _tool_data(name_response) is not None:
+            self.log_result("MCP Name Region", True, "Region named successfully")
+
+            # Listen for region_named event
+            print("📡 Waiting for region_named event...")
+            region_named_event = self.wait_for_event("region_named", 2.0)
+            if region_named_event:
+                self.log_result("Region Naming Event", True, f"Region named: {_path(region_named_event, ('data', 'name'), 'unknown')}")
+            else:
+                self.log_result("Region Naming Event", False, "region_named event not received")
+        else:
+            self.log_result("MCP Name Region", False, f"Failed: {_error_message(name_response)}")
+
+        # Test 8: Create POI
+        if _tool_data(poi_response) is not None:
             self.log_result("MCP Create POI", True, "POI created successfully")
 
             # Listen for poi_created event
             print("📡 Waiting for poi_created event...")
-            events = self.listen_websocket_events(2.0)
-            poi_created_event = next((e for e in events if e.get("type") == "poi_created"), None)
+            poi_created_event = self.wait_for_event("poi_created", 2.0)
             if poi_created_event:
-                self.log_result("POI Creation Event", True, f"POI created: {poi_created_event.get('data', {}).get('name', 'unknown')}")
+                self.log_result("POI Creation Event", True, f"POI created: {_path(poi_created_event, ('data', 'name'), 'unknown')}")
             else:
                 self.log_result("POI Creation Event", False, "poi_created event not received")
         else:
-            self.log_result("MCP Create POI", False, f"Failed: {poi_response.get('error', 'Unknown error')}")
+            self.log_result("MCP Create POI", False, f"Failed: {_error_message(poi_response)}")
 
         return True
 
@@ -265,29 +525,32 @@ class MCPProtocolTester:
 
         # Test database connection
         try:
-            conn = sqlite3.connect("spectre_world.db")
+            # Open read-only, as the server's reader pool does, so this
+            # check never competes with the server for the write lock
+            uri = f"file:{quote(os.path.abspath('spectre_world.db'))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=5000")
             cursor = conn.cursor()
 
-            # Check if world is saved in database
-            cursor.execute("SELECT id FROM worlds WHERE id = ?", (self.world_id,))
-            world_exists = cursor.fetchone() is not None
+            # Check the saved world and its POIs in one query
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM worlds WHERE id = ?), "
+                "(SELECT COUNT(*) FROM pois WHERE world_id = ?)",
+                (self.world_id, self.world_id)
+            )
+            world_exists, poi_count = cursor.fetchone()
+            conn.close()
 
             if world_exists:
                 self.log_result("Database World Save", True, "World found in database")
             else:
                 self.log_result("Database World Save", False, "World not found in database")
 
-            # Test database operations
-            cursor.execute("SELECT COUNT(*) FROM pois WHERE world_id = ?", (self.world_id,))
-            poi_count = cursor.fetchone()[0]
-
             if poi_count > 0:
                 self.log_result("Database POI Save", True, f"{poi_count} POIs found in database")
             else:
                 self.log_result("Database POI Save", False, "No POIs found in database")
 
-            conn.close()
-
         except Exception as e:
             self.log_result("Database Operations", False, f"Database error: {str(e)}")
             return False
@@ -306,18 +569,13 @@ class MCPProtocolTester:
             return False
 
         # Test world retrieval after restart
-        get_world_cmd = {
-            "tool": "get_world",
-            "arguments": {
-                "world_id": self.world_id
-            }
-        }
+        get_world_cmd = _WORLD_TOOL_TEMPLATE.format(id=next(self._request_ids), tool="get_world", world_id=self.world_id)
 
         world_response = self.send_mcp_command(get_world_cmd)
-        if world_response.get("type") == "success":
+        if _tool_data(world_response) is not None:
             self.log_result("World Recovery After Restart", True, "World successfully recovered after server restart")
         else:
-            self.log_result("World Recovery After Restart", False, f"Failed to recover world: {world_response.get('error', 'Unknown error')}")
+            self.log_result("World Recovery After Restart", False, f"Failed to recover world: {_error_message(world_response)}")
 
         return True
 
@@ -327,6 +585,8 @@ class MCPProtocolTester:
 
         # Test 1: Generate world lore
         lore_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "generate_world_lore",
             "arguments": {
                 "world_id": self.world_id,
@@ -335,22 +595,10 @@ class MCPProtocolTester:
             }
         }
 
-        lore_response = self.send_mcp_command(lore_cmd)
-        if lore_response.get("type") == "success":
-            self.log_result("World Lore Generation", True, "Lore generated successfully")
-
-            # Listen for lore_created event
-            events = self.listen_websocket_events(2.0)
-            lore_event = next((e for e in events if e.get("type") == "lore_created"), None)
-            if lore_event:
-                self.log_result("Lore Creation Event", True, f"Lore event received: {lore_event.get('data', {}).get('title', 'unknown')}")
-            else:
-                self.log_result("Lore Creation Event", False, "lore_created event not received")
-        else:
-            self.log_result("World Lore Generation", False, f"Failed: {lore_response.get('error', 'Unknown error')}")
-
         # Test 2: Add historical event
         event_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "add_historical_event",
             "arguments": {
                 "world_id": self.world_id,
@@ -360,29 +608,13 @@ class MCPProtocolTester:
             }
         }
 
-        event_response = self.send_mcp_command(event_cmd)
-        if event_response.get("type") == "success":
-            self.log_result("Historical Event Addition", True, "Historical event added successfully")
-        else:
-            self.log_result("Historical Event Addition", False, f"Failed: {event_response.get('error', 'Unknown error')}")
-
         # Test 3: Get statistics
-        stats_cmd = {
-            "tool": "get_statistics",
-            "arguments": {
-                "world_id": self.world_id
-            }
-        }
-
-        stats_response = self.send_mcp_command(stats_cmd)
-        if stats_response.get("type") == "success":
-            stats = stats_response.get("result", {}).get("statistics", {})
-            self.log_result("World Statistics", True, f"Statistics retrieved: {stats}")
-        else:
-            self.log_result("World Statistics", False, f"Failed: {stats_response.get('error', 'Unknown error')}")
+        stats_cmd = _WORLD_TOOL_TEMPLATE.format(id=next(self._request_ids), tool="get_statistics", world_id=self.world_id)
 
         # Test 4: Batch operations
         batch_name_cmd = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
             "tool": "batch_name_regions",
             "arguments": {
                 "world_id": self.world_id,
@@ -395,12 +627,41 @@ class MCPProtocolTester:
             }
         }
 
-        batch_response = self.send_mcp_command(batch_name_cmd)
-        if batch_response.get("type") == "success":
-            named_count = batch_response.get("result", {}).get("named_regions", 0)
+        # The four workflow steps are independent, so they go out as one batch
+        lore_response, event_response, stats_response, batch_response = self.send_mcp_batch(
+            [lore_cmd, event_cmd, stats_cmd, batch_name_cmd]
+        )
+
+        if _tool_data(lore_response) is not None:
+            self.log_result("World Lore Generation", True, "Lore generated successfully")
+
+            # Listen for lore_created event
+            lore_event = self.wait_for_event("lore_created", 2.0)
+            if lore_event:
+                self.log_result("Lore Creation Event", True, f"Lore event received: {_path(lore_event, ('data', 'title'), 'unknown')}")
+            else:
+                self.log_result("Lore Creation Event", False, "lore_created event not received")
+        else:
+            self.log_result("World Lore Generation", False, f"Failed: {_error_message(lore_response)}")
+
+        if _tool_data(event_response) is not None:
+            self.log_result("Historical Event Addition", True, "Historical event added successfully")
+        else:
+            self.log_result("Historical Event Addition", False, f"Failed: {_error_message(event_response)}")
+
+        stats_data = _tool_data(stats_response)
+        if stats_data is not None:
+            stats = stats_data.get("statistics", {})
+            self.log_result("World Statistics", True, f"Statistics retrieved: {stats}")
+        else:
+            self.log_result("World Statistics", False, f"Failed: {_error_message(stats_response)}")
+
+        batch_data = _tool_data(batch_response)
+        if batch_data is not None:
+            named_count = batch_data.get("named_regions", 0)
             self.log_result("Batch Region Naming", True, f"Named {named_count} regions successfully")
         else:
-            self.log_result("Batch Region Naming", False, f"Failed: {batch_response.get('error', 'Unknown error')}")
+            self.log_result("Batch Region Naming", False, f"Failed: {_error_message(batch_response)}")
 
         return True
 
@@ -409,47 +670,35 @@ class MCPProtocolTester:
         print("\n🛡️ Testing Error Handling...")
 
         # Test invalid command
-        invalid_cmd = {
-            "tool": "invalid_command",
-            "arguments": {}
-        }
+        invalid_cmd = _INVALID_COMMAND_TEMPLATE.format(id=next(self._request_ids))
 
-        invalid_response = self.send_mcp_command(invalid_cmd)
-        if invalid_response.get("type") == "error":
+        # Test missing parameters (no x and y)
+        missing_params_cmd = _WORLD_TOOL_TEMPLATE.format(id=next(self._request_ids), tool="get_region", world_id=self.world_id)
+
+        # Test invalid JSON
+        invalid_json = "invalid json data"
+
+        # All three checks are independent, so they go out as one batch
+        invalid_response, missing_response, invalid_json_response = self.send_mcp_batch(
+            [invalid_cmd, missing_params_cmd, invalid_json]
+        )
+
+        if _path(invalid_response, ("error", "code")) == -32601:
             self.log_result("Invalid Command Handling", True, "Invalid command properly rejected")
         else:
             self.log_result("Invalid Command Handling", False, "Invalid command not properly handled")
 
-        # Test missing parameters
-        missing_params_cmd = {
-            "tool": "get_region",
-            "arguments": {
-                "world_id": self.world_id
-                # Missing x and y
-            }
-        }
-
-        missing_response = self.send_mcp_command(missing_params_cmd)
-        if missing_response.get("type") == "error":
+        # The handler accepts the call, and get_region reports the missing
+        # coordinates inside the result
+        if _path(missing_response, ("result", "data", "error")) is not None:
             self.log_result("Missing Parameters Handling", True, "Missing parameters properly handled")
         else:
             self.log_result("Missing Parameters Handling", False, "Missing parameters not properly handled")
 
-        # Test invalid JSON
-        try:
-            self.server_process.stdin.write("invalid json data\n")
-            self.server_process.stdin.flush()
-
-            # Should get error response
-            response_line = self.server_process.stdout.readline().strip()
-            response = json.loads(response_line)
-
-            if response.get("type") == "error":
-                self.log_result("Invalid JSON Handling", True, "Invalid JSON properly rejected")
-            else:
-                self.log_result("Invalid JSON Handling", False, "Invalid JSON not properly handled")
-        except Exception as e:
-            self.log_result("Invalid JSON Handling", False, f"Exception during invalid JSON test: {str(e)}")
+        if _path(invalid_json_response, ("error", "code")) == -32700:
+            self.log_result("Invalid JSON Handling", True, "Invalid JSON properly rejected")
+        else:
+            self.log_result("Invalid JSON Handling", False, "Invalid JSON not properly handled")
 
         return True
 
@@ -458,13 +707,13 @@ class MCPProtocolTester:
         print("\n📊 Generating Test Report...")
 
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
+        passed_tests = self.passed_tests
         pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
 
         report = {
             "test_session": {
-                "start_time": self.test_results[0]["timestamp"] if self.test_results else time.strftime("%Y-%m-%d %H:%M:%S"),
-                "end_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "start_time": self.test_results[0]["timestamp"] if self.test_results else self._timestamp(),
+                "end_time": self._timestamp(),
                 "total_tests": total_tests,
                 "passed_tests": passed_tests,
                 "failed_tests": total_tests - passed_tests,
@@ -472,13 +721,14 @@ class MCPProtocolTester:
             },
             "test_results": self.test_results,
             "events_received": len(self.events_received),
-            "event_types": list({event.get("type") for event in self.events_received}),
+            "event_types": list(self.event_types),
             "summary": "SPECTRE System Integration Testing Complete"
         }
 
         # Write report to file
-        with open("TEST_RESULTS.json", "w") as f:
-            json.dump(report, f, indent=2)
+        # Serialized up front so the file gets a single write
+        with open("TEST_RESULTS.json", "wb", buffering=0) as f:
+            f.write(_dumps_report(report))
 
         print(f"📈 Test Results: {passed_tests}/{total_tests} passed ({pass_rate:.1f}%)")
         print(f"📡 Events Received: {len(self.events_received)}")
@@ -536,12 +786,11 @@ def main():
     """Main test execution."""
     tester = MCPProtocolTester()
 
-    # Check if server is already running
-    try:
-        response = requests.get("http://localhost:8000", timeout=1)
-        print("⚠️  Server is already running - tests may conflict")
-    except requests.RequestException:
-        pass
+    # Check if server is already running on its default port
+    with socket.socket() as probe:
+        probe.settimeout(0.05)
+        if probe.connect_ex(("127.0.0.1", SERVER_DEFAULT_PORT)) == 0:
+            print("⚠️  Server is already running - tests may conflict")
 
     # Run tests
     success = tester.run_all_tests()
@@ -8,37 +8,83 @@ Simplified testing focusing on MCP protocol communication without terrain genera
 import json
 import sys
 import time
+import select
+import socket
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import websocket
 import sqlite3
 import os
+from urllib.parse import quote
 from typing import Dict, Any, List
 
+try:
+    import orjson
+
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return json.dumps(obj, indent=2).encode()
+
+# Port the tester starts uvicorn on
+SERVER_PORT = 8000
+
+# Longest time to wait for uvicorn to accept connections, and the pause
+# between connection attempts
+SERVER_READY_TIMEOUT = 5.0
+SERVER_POLL_INTERVAL = 0.05
+
+# Tables the server's schema must create
+REQUIRED_TABLES = frozenset({"worlds", "events", "pois", "lore", "timeline"})
+
 class SimpleMCPTester:
     """Simple MCP protocol tester without terrain generation dependencies."""
 
+    # Constant probe sent before listening for events, serialized once
+    _TEST_FRAME = json.dumps({"type": "test", "message": "WebSocket test"})
+
     def __init__(self):
         self.server_process = None
         self.websocket_connection = None
         self.test_results = []
         self.world_id = None
         self.events_received = []
+        self._timestamp_second = None
+        self._timestamp_text = ""
+        # Probes run concurrently, so results are recorded under a lock
+        self._results_lock = threading.Lock()
+
+        # One keep-alive session for every HTTP probe
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
     def log_result(self, test_name: str, success: bool, details: str = ""):
         """Log test result."""
-        result = {
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        self.test_results.append(result)
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if details:
-            print(f"    {details}")
+        with self._results_lock:
+            self.test_results.append({
+                "test": test_name,
+                "success": success,
+                "details": details,
+                "timestamp": self._timestamp()
+            })
+            print(f"{status} {test_name}")
+            if details:
+                print(f"    {details}")
+
+    def _timestamp(self) -> str:
+        """Current local time, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._timestamp_text
 
     def start_server(self):
         """Start the SPECTRE server."""
@@ -46,19 +92,42 @@ class SimpleMCPTester:
         try:
             # Start server using uvicorn directly to avoid subprocess issues
             self.server_process = subprocess.Popen(
-                ["uvicorn", "server.main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"],
+                ["uvicorn", "server.main:app", "--host", "0.0.0.0", "--port", str(SERVER_PORT), "--reload"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
-
-            # Wait for server to start
-            time.sleep(5)
-            return True
         except Exception as e:
             self.log_result("Server Startup", False, f"Failed to start server: {str(e)}")
             return False
 
+        if not self.wait_for_server():
+            self.log_result("Server Startup", False, f"Server not listening on port {SERVER_PORT} after {SERVER_READY_TIMEOUT:.0f}s")
+            return False
+        return True
+
+    def wait_for_server(self, timeout: float = SERVER_READY_TIMEOUT) -> bool:
+        """
+        Poll the server port until it accepts connections.
+
+        Args:
+            timeout: Seconds to keep polling before giving up
+
+        Returns:
+            True once the port accepts a connection, False on timeout or
+            if the server process exits first
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.server_process.poll() is not None:
+                return False
+            try:
+                with socket.create_connection(("127.0.0.1", SERVER_PORT), timeout=SERVER_POLL_INTERVAL):
+                    return True
+            except OSError:
+                time.sleep(SERVER_POLL_INTERVAL)
+        return False
+
     def stop_server(self):
         """Stop the SPECTRE server."""
         if self.server_process:
@@ -87,14 +156,14 @@ class SimpleMCPTester:
         """Test HTTP API endpoints."""
         try:
             # Test server health
-            response = requests.get("http://localhost:8000", timeout=5)
+            response = self.http.get("http://localhost:8000", timeout=5)
             if response.status_code == 200:
                 self.log_result("HTTP Server Health", True, "Server responding to HTTP requests")
             else:
                 self.log_result("HTTP Server Health", False, f"Unexpected status code: {response.status_code}")
 
             # Test API docs
-            response = requests.get("http://localhost:8000/docs", timeout=5)
+            response = self.http.get("http://localhost:8000/docs", timeout=5)
             if response.status_code == 200:
                 self.log_result("API Documentation", True, "API docs accessible")
             else:
@@ -110,29 +179,49 @@ class SimpleMCPTester:
 
         try:
             # Send a test message to see if we get any response
-            test_message = {"type": "test", "message": "WebSocket test"}
-            self.websocket_connection.send(json.dumps(test_message))
+            self.websocket_connection.send(self._TEST_FRAME)
 
-            # Listen for events
+            # Listen for events, sleeping in select until a frame arrives
             events = []
-            start_time = time.time()
             timeout = 3.0
+            deadline = time.monotonic() + timeout
+            sock = self.websocket_connection.sock
+            # Only bounds a recv stuck on a partially received frame
+            sock.settimeout(timeout)
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                readable, _, _ = select.select([sock], [], [], remaining)
+                if not readable:
+                    break
 
-            while time.time() - start_time < timeout:
+                # Drain every frame already received before going back to
+                # select; websocket-client keeps a partly read frame
+                # buffered, so stopping mid-frame is safe
+                batch = []
+                closed = False
+                sock.setblocking(False)
                 try:
-                    if self.websocket_connection.sock:
-                        self.websocket_connection.sock.settimeout(0.1)
-                    message = self.websocket_connection.recv()
-                    if message:
-                        event_data = json.loads(message)
-                        events.append(event_data)
-                        self.events_received.append(event_data)
-                        print(f"📡 WebSocket Event: {event_data.get('type', 'unknown')}")
-                except websocket.WebSocketTimeoutException:
-                    continue
-                except Exception as e:
-                    if "timed out" in str(e).lower():
-                        continue
+                    while True:
+                        message = self.websocket_connection.recv()
+                        if message:
+                            batch.append(json.loads(message))
+                except BlockingIOError:
+                    pass
+                except websocket.WebSocketConnectionClosedException:
+                    closed = True
+                finally:
+                    # websocket-client closes the socket when the server does
+                    if self.websocket_connection.sock is not None:
+                        sock.settimeout(timeout)
+
+                events.extend(batch)
+                self.events_received.extend(batch)
+                for event_data in batch:
+                    print(f"📡 WebSocket Event: {event_data.get('type', 'unknown')}")
+                if closed:
                     break
 
             if events:
@@ -149,23 +238,23 @@ class SimpleMCPTester:
     def test_database_operations(self):
         """Test database persistence operations."""
         try:
-            # Test database connection
-            conn = sqlite3.connect("spectre_world.db")
+            # Open read-only, as the server's reader pool does, so this
+            # check never competes with the running server for the write lock
+            uri = f"file:{quote(os.path.abspath('spectre_world.db'))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True)
+            conn.execute("PRAGMA busy_timeout=5000")
             cursor = conn.cursor()
 
             # Check if database has required tables
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-
-            required_tables = ['worlds', 'events', 'pois', 'lore', 'timeline']
-            missing_tables = [table for table in required_tables if table not in tables]
+            missing_tables = sorted(REQUIRED_TABLES.difference(row[0] for row in cursor))
+            conn.close()
 
             if not missing_tables:
                 self.log_result("Database Schema", True, "All required tables exist")
             else:
                 self.log_result("Database Schema", False, f"Missing tables: {', '.join(missing_tables)}")
 
-            conn.close()
             return True
 
         except Exception as e:
@@ -186,14 +275,16 @@ class SimpleMCPTester:
             self.stop_server()
             return False
 
-        # Test HTTP endpoints
-        self.test_http_endpoints()
-
-        # Test WebSocket events
-        self.test_websocket_events()
-
-        # Test database
-        self.test_database_operations()
+        # HTTP endpoints, WebSocket events and the database are independent,
+        # so they are probed concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            probes = [
+                executor.submit(self.test_http_endpoints),
+                executor.submit(self.test_websocket_events),
+                executor.submit(self.test_database_operations)
+            ]
+            for probe in probes:
+                probe.result()
 
         return True
 
@@ -207,8 +298,8 @@ class SimpleMCPTester:
 
         report = {
             "test_session": {
-                "start_time": self.test_results[0]["timestamp"] if self.test_results else time.strftime("%Y-%m-%d %H:%M:%S"),
-                "end_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "start_time": self.test_results[0]["timestamp"] if self.test_results else self._timestamp(),
+                "end_time": self._timestamp(),
                 "total_tests": total_tests,
                 "passed_tests": passed_tests,
                 "failed_tests": total_tests - passed_tests,
@@ -221,8 +312,8 @@ class SimpleMCPTester:
         }
 
         # Write report to file
-        with open("TEST_RESULTS_SIMPLE.json", "w") as f:
-            json.dump(report, f, indent=2)
+        with open("TEST_RESULTS_SIMPLE.json", "wb", buffering=0) as f:
+            f.write(_dumps_report(report))
 
         print(f"📈 Test Results: {passed_tests}/{total_tests} passed ({pass_rate:.1f}%)")
         print(f"📡 Events Received: {len(self.events_received)}")
@@ -259,6 +350,7 @@ def main():
         # Cleanup
         tester.disconnect_websocket()
         tester.stop_server()
+        tester.http.close()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
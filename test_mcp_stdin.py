@@ -11,8 +11,33 @@ import time
 import socket
 import subprocess
 import threading
+import os
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, List
 
+try:
+    import orjson
+
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_report(obj: Any) -> bytes:
+        """Serialize the test report as indented JSON."""
+        return json.dumps(obj, indent=2).encode()
+
+# Address the tester sends newline-delimited MCP commands to
+MCP_SOCKET_ADDRESS = ("localhost", 8001)
+
+# Longest time to wait for the MCP socket to connect or respond
+MCP_RESPONSE_TIMEOUT = 10.0
+
+# Initial size of the reusable MCP receive buffer; doubled when a response
+# does not fit
+MCP_RECV_BUFFER_SIZE = 8192
+
 class MCPSTDINTester:
     """Test MCP protocol via stdin communication."""
 
@@ -20,6 +45,20 @@ class MCPSTDINTester:
         self.test_results = []
         self.events_received = []
         self.world_id = None
+        self._timestamp_second = None
+        self._timestamp_text = ""
+
+        # Persistent MCP connection, opened on first use. Responses are
+        # received into _mcp_buf, whose first _mcp_len bytes are filled
+        # (data past the end of the last response line)
+        self._mcp_sock = None
+        self._mcp_buf = bytearray(MCP_RECV_BUFFER_SIZE)
+        self._mcp_len = 0
+        self._mcp_lock = threading.Lock()
+
+        # One keep-alive session for every HTTP API fallback call
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
     def log_result(self, test_name: str, success: bool, details: str = ""):
         """Log test result."""
@@ -27,7 +66,7 @@ class MCPSTDINTester:
             "test": test_name,
             "success": success,
             "details": details,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": self._timestamp()
         }
         self.test_results.append(result)
         status = "✅ PASS" if success else "❌ FAIL"
@@ -35,75 +74,132 @@ class MCPSTDINTester:
         if details:
             print(f"    {details}")
 
-    def send_mcp_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
-        """Send MCP command to server via socket connection."""
-        try:
-            # Connect to server's MCP handler (we'll use a socket connection)
-            # Since the server is running with uvicorn, we need to send commands via stdin
-            # Let's try to connect to the server process directly
+    def _timestamp(self) -> str:
+        """Current local time, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._timestamp_text
 
-            # For now, let's create a test command and send it via a TCP socket
-            # The MCP handler should be listening on stdin
+    def send_mcp_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send MCP command to server via socket connection.
 
-            # Create a socket connection to send commands
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        Commands share one persistent connection. A connection error closes
+        it and the command is retried once on a fresh connection before
+        falling back to the HTTP API.
 
-            try:
-                # Connect to localhost on a port (we'll use 8001 for MCP communication)
-                sock.connect(('localhost', 8001))
+        Args:
+            command: MCP command dictionary
 
-                # Send command
-                command_json = json.dumps(command) + "\n"
-                sock.sendall(command_json.encode('utf-8'))
+        Returns:
+            Decoded response, or an error dictionary
+        """
+        try:
+            line = json.dumps(command).encode('utf-8') + b"\n"
+
+            with self._mcp_lock:
+                for attempt in range(2):
+                    try:
+                        response = self._mcp_exchange(line)
+                        break
+                    except OSError as e:
+                        self.close_mcp_socket()
+                        error = e
+                else:
+                    print(f"Socket communication failed: {error}")
+
+                    # Fallback: try to send via HTTP API instead
+                    return self.send_via_http_api(command)
 
-                # Receive response
-                response = sock.recv(4096).decode('utf-8').strip()
+            try:
                 return json.loads(response)
-
-            except Exception as e:
+            except ValueError as e:
                 print(f"Socket communication failed: {e}")
-
-                # Fallback: try to send via HTTP API instead
                 return self.send_via_http_api(command)
 
-            finally:
-                sock.close()
-
         except Exception as e:
             return {"error": f"MCP command failed: {str(e)}"}
 
+    def _mcp_exchange(self, line: bytes) -> bytes:
+        """
+        Send one command line and read one response line.
+
+        Args:
+            line: Newline-terminated JSON command
+
+        Returns:
+            Response line without its trailing newline
+
+        Raises:
+            OSError: If the connection fails, times out or is closed by
+                the server
+        """
+        if self._mcp_sock is None:
+            self._mcp_sock = socket.create_connection(MCP_SOCKET_ADDRESS, timeout=MCP_RESPONSE_TIMEOUT)
+            self._mcp_len = 0
+
+        self._mcp_sock.sendall(line)
+
+        # Responses may arrive split across several reads; each one lands
+        # directly in the reusable buffer and only the new bytes are scanned
+        end = self._mcp_buf.find(b"\n", 0, self._mcp_len)
+        while end < 0:
+            if self._mcp_len == len(self._mcp_buf):
+                self._mcp_buf.extend(bytes(len(self._mcp_buf)))
+            with memoryview(self._mcp_buf) as view:
+                received = self._mcp_sock.recv_into(view[self._mcp_len:])
+            if not received:
+                raise ConnectionError("MCP connection closed by server")
+            end = self._mcp_buf.find(b"\n", self._mcp_len, self._mcp_len + received)
+            self._mcp_len += received
+
+        with memoryview(self._mcp_buf) as view:
+            response = bytes(view[:end])
+
+        # Move anything received past this line to the front of the buffer
+        remaining = self._mcp_len - end - 1
+        self._mcp_buf[:remaining] = self._mcp_buf[end + 1:self._mcp_len]
+        self._mcp_len = remaining
+        return response
+
+    def close_mcp_socket(self):
+        """Close the persistent MCP connection, if open."""
+        if self._mcp_sock is not None:
+            self._mcp_sock.close()
+            self._mcp_sock = None
+
     def send_via_http_api(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback: send command via HTTP API."""
         try:
-            import requests
-
             # Map MCP commands to HTTP API endpoints
             tool = command.get("tool")
             args = command.get("arguments", {})
 
             if tool == "create_world":
                 url = "http://localhost:8000/api/worlds"
-                response = requests.post(url, json=args, timeout=10)
+                response = self.http.post(url, json=args, timeout=10)
                 return response.json()
 
             elif tool == "get_world":
                 url = f"http://localhost:8000/api/worlds/{args.get('world_id')}"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, timeout=10)
                 return response.json()
 
             elif tool == "get_region":
                 url = f"http://localhost:8000/api/worlds/{args.get('world_id')}/regions/{args.get('x')}/{args.get('y')}"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, timeout=10)
                 return response.json()
 
             elif tool == "name_region":
                 url = "http://localhost:8000/api/worlds/regions/name"
-                response = requests.post(url, json=args, timeout=10)
+                response = self.http.post(url, json=args, timeout=10)
                 return response.json()
 
             elif tool == "get_statistics":
                 url = f"http://localhost:8000/api/worlds/{args.get('world_id')}/statistics"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, timeout=10)
                 return response.json()
 
             else:
@@ -206,33 +302,32 @@ class MCPSTDINTester:
         try:
             import sqlite3
 
-            # Connect to database
-            conn = sqlite3.connect("spectre_world.db")
+            # Open read-only, as the server's reader pool does, so this
+            # check never competes with the running server for the write lock
+            uri = f"file:{quote(os.path.abspath('spectre_world.db'))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True)
+            conn.execute("PRAGMA busy_timeout=5000")
             cursor = conn.cursor()
 
-            # Check if our test world exists
-            cursor.execute("SELECT id FROM worlds WHERE id = ?", (self.world_id,))
-            world_exists = cursor.fetchone() is not None
+            # Load our test world and count its POIs in one query
+            cursor.execute(
+                "SELECT (SELECT data FROM worlds WHERE id = ?), "
+                "(SELECT COUNT(*) FROM pois WHERE world_id = ?)",
+                (self.world_id, self.world_id)
+            )
+            world_data_json, poi_count = cursor.fetchone()
+            conn.close()
 
-            if world_exists:
+            if world_data_json is not None:
                 self.log_result("Database World Save", True, "World found in database")
 
-                # Load world data
-                cursor.execute("SELECT data FROM worlds WHERE id = ?", (self.world_id,))
-                world_data_json = cursor.fetchone()[0]
                 world_data = json.loads(world_data_json)
-
                 self.log_result("Database World Load", True, f"World loaded: {world_data.get('width', 'N/A')}x{world_data.get('height', 'N/A')}")
 
             else:
                 self.log_result("Database World Save", False, "World not found in database")
 
-            # Check POI count
-            cursor.execute("SELECT COUNT(*) FROM pois WHERE world_id = ?", (self.world_id,))
-            poi_count = cursor.fetchone()[0]
             self.log_result("Database POI Count", True, f"Found {poi_count} POIs")
-
-            conn.close()
             return True
 
         except Exception as e:
@@ -266,8 +361,8 @@ class MCPSTDINTester:
 
         report = {
             "test_session": {
-                "start_time": self.test_results[0]["timestamp"] if self.test_results else time.strftime("%Y-%m-%d %H:%M:%S"),
-                "end_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "start_time": self.test_results[0]["timestamp"] if self.test_results else self._timestamp(),
+                "end_time": self._timestamp(),
                 "total_tests": total_tests,
                 "passed_tests": passed_tests,
                 "failed_tests": total_tests - passed_tests,
@@ -279,8 +374,8 @@ class MCPSTDINTester:
         }
 
         # Write report to file
-        with open("TEST_RESULTS_COMPREHENSIVE.json", "w") as f:
-            json.dump(report, f, indent=2)
+        with open("TEST_RESULTS_COMPREHENSIVE.json", "wb", buffering=0) as f:
+            f.write(_dumps_report(report))
 
         print(f"📈 Test Results: {passed_tests}/{total_tests} passed ({pass_rate:.1f}%)")
 
@@ -313,6 +408,9 @@ def main():
     except Exception as e:
         print(f"❌ Test execution failed: {str(e)}")
         return 1
+    finally:
+        tester.close_mcp_socket()
+        tester.http.close()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
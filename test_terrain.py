@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Terrain generation tests
+
+Covers heightmap erosion, mesh simplification edge cases and mesh file
+round trips.
+"""
+
+import numpy as np
+import pytest
+
+from terrain.mesh import TerrainMeshGenerator
+from terrain.noise import apply_erosion
+
+
+def _max_mesh_error(mesh_data, heightmap):
+    """Largest vertical gap between a mesh and the heightmap samples it covers"""
+    vertices = np.asarray(mesh_data['vertices']).reshape(-1, 3)
+    triangles = np.asarray(mesh_data['indices']).reshape(-1, 3)
+    grid_z, grid_x = np.mgrid[0:heightmap.shape[0], 0:heightmap.shape[1]]
+    points = np.column_stack((grid_x.ravel(), grid_z.ravel())).astype(np.float64)
+    worst = np.full(points.shape[0], np.inf)
+
+    for corners in vertices[triangles]:
+        (x0, y0, z0), (x1, y1, z1), (x2, y2, z2) = corners
+        det = (x1 - x0) * (z2 - z0) - (x2 - x0) * (z1 - z0)
+        u = ((points[:, 0] - x0) * (z2 - z0) - (x2 - x0) * (points[:, 1] - z0)) / det
+        v = ((x1 - x0) * (points[:, 1] - z0) - (points[:, 0] - x0) * (z1 - z0)) / det
+        inside = (u >= -1e-9) & (v >= -1e-9) & (u + v <= 1 + 1e-9)
+        height = y0 + u * (y1 - y0) + v * (y2 - y0)
+        worst[inside] = np.minimum(worst[inside], np.abs(height - heightmap.ravel())[inside])
+
+    assert np.isfinite(worst).all(), "mesh should cover every heightmap sample"
+    return worst.max()
+
+
+@pytest.mark.parametrize("shape, radius", [
+    ((3, 3), 2),
+    ((4, 4), 2),
+    ((1, 10), 1),
+    ((10, 1), 1),
+    ((2, 8), 1),
+    ((8, 2), 1)
+])
+def test_erosion_without_interior(shape, radius):
+    """Grids with no cell a full radius from every edge come back unchanged"""
+    heightmap = np.random.default_rng(0).random(shape)
+
+    eroded = apply_erosion(heightmap, iterations=2, radius=radius)
+
+    assert eroded is not heightmap, "apply_erosion should return a copy"
+    np.testing.assert_array_equal(eroded, heightmap)
+
+
+def test_erosion_smallest_interior():
+    """A 3x3 grid with radius 1 erodes only its centre cell"""
+    heightmap = np.zeros((3, 3))
+    heightmap[1, 1] = 1.0
+
+    eroded = apply_erosion(heightmap, iterations=1, radius=1)
+
+    expected = np.zeros((3, 3))
+    expected[1, 1] = 0.5
+    np.testing.assert_allclose(eroded, expected)
+
+
+def test_adaptive_mesh_error_bound():
+    """With a full vertex budget every sample ends up within max_error"""
+    pytest.importorskip("scipy")
+    z, x = np.mgrid[0:33, 0:33] / 32.0
+    heightmap = np.sin(x * 6.0) * np.cos(z * 4.0) + 0.2 * x
+
+    mesh_data = TerrainMeshGenerator().generate_simplified_mesh(heightmap, simplification=1, max_error=0.02)
+
+    assert len(mesh_data['vertices']) // 3 < heightmap.size, "flat-enough areas should be simplified"
+    assert _max_mesh_error(mesh_data, heightmap) <= 0.02
+
+
+def test_adaptive_mesh_respects_budget():
+    """A tight tolerance never spends more vertices than the stride mesh"""
+    pytest.importorskip("scipy")
+    heightmap = np.random.default_rng(1).random((40, 40))
+
+    mesh_data = TerrainMeshGenerator().generate_simplified_mesh(heightmap, simplification=4, max_error=1e-6)
+
+    assert len(mesh_data['vertices']) // 3 <= 10 * 10
+
+
+@pytest.mark.parametrize("shape", [(1, 10), (10, 1), (1, 1)], ids=["row", "column", "single"])
+def test_adaptive_mesh_degenerate_shape(shape):
+    """Heightmaps one sample wide fall back to the stride mesh"""
+    heightmap = np.random.default_rng(2).random(shape)
+    generator = TerrainMeshGenerator()
+
+    adaptive = generator.generate_simplified_mesh(heightmap, simplification=2, max_error=0.01)
+
+    assert adaptive == generator.generate_simplified_mesh(heightmap, simplification=2)
+
+
+@pytest.mark.parametrize("options", [
+    {"binary": True},
+    {"sidecar": True},
+    {"quantize": True},
+    {"sidecar": True, "quantize": True}
+], ids=["binary", "sidecar", "quantized", "sidecar-quantized"])
+@pytest.mark.parametrize("layout", ["soa", "interleaved"])
+def test_mesh_file_round_trip(tmp_path, options, layout):
+    """Meshes saved in each binary mode load back with the same arrays"""
+    generator = TerrainMeshGenerator()
+    heightmap = np.random.default_rng(3).random((9, 12))
+    mesh_data = generator.generate_mesh_data(heightmap, layout=layout)
+    filename = str(tmp_path / "mesh.json")
+
+    generator.save_mesh_to_json(mesh_data, filename, **options)
+    loaded = generator.load_mesh_from_json(filename)
+
+    assert (tmp_path / "mesh.bin").exists() == bool(options.get("sidecar"))
+    assert loaded.keys() == mesh_data.keys()
+    for field, value in mesh_data.items():
+        if field == "indices":
+            np.testing.assert_array_equal(loaded[field], value)
+        elif field == "vertices" and options.get("quantize"):
+            # 16 bits per axis: within one step of each axis extent
+            positions = np.asarray(value).reshape(-1, 3)
+            step = (positions.max(axis=0) - positions.min(axis=0)) / 65535
+            assert (np.abs(loaded[field].reshape(-1, 3) - positions) <= step).all()
+        elif isinstance(value, list):
+            assert loaded[field].dtype == np.float32
+            np.testing.assert_allclose(loaded[field], value, rtol=1e-6)
+        else:
+            assert loaded[field] == value
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+World engine tests
+
+Covers the spatial POI index, POI paging and the terrain cache.
+"""
+
+import pytest
+
+from server.world_engine import POI_GRID_CELL_SIZE, WorldEngine
+
+
+@pytest.fixture
+def engine():
+    """A fresh engine, so worlds and caches never leak between tests"""
+    return WorldEngine()
+
+
+@pytest.fixture
+def world_id(engine):
+    """A small world with no POIs"""
+    return engine.create_world(width=32, height=32, seed="7", island_mode=False)["id"]
+
+
+def _near_ids(engine, world_id, x, y, radius):
+    """IDs of the POIs get_pois_near finds around a tile"""
+    return sorted(poi["id"] for poi in engine.get_pois_near(world_id, x, y, radius))
+
+
+def test_pois_near_radius_boundary(engine, world_id):
+    """POIs exactly on the radius are found, ones just outside it are not"""
+    # (7, 7) and (10, 11) lie in different index cells, 5 tiles apart
+    inside = engine.create_poi(world_id, "town", POI_GRID_CELL_SIZE - 1, POI_GRID_CELL_SIZE - 1)
+    near = engine.create_poi(world_id, "ruin", 11, 11)
+
+    assert _near_ids(engine, world_id, 10, 11, 5) == sorted([inside["id"], near["id"]])
+    assert _near_ids(engine, world_id, 11, 11, 5) == [near["id"]]
+    assert _near_ids(engine, world_id, 10, 11, 0) == []
+
+
+def test_pois_near_after_move_across_cells(engine, world_id):
+    """A POI moved into another index cell is only found at its new spot"""
+    poi = engine.create_poi(world_id, "town", 2, 2)
+
+    engine.update_poi(world_id, poi["id"], {"x": 20, "y": 25})
+
+    assert _near_ids(engine, world_id, 2, 2, 3) == []
+    assert _near_ids(engine, world_id, 20, 25, 0) == [poi["id"]]
+
+
+@pytest.mark.parametrize("updates", [{"x": "20"}, {"x": None}, {"y": [1]}], ids=["string", "none", "list"])
+def test_update_poi_rejects_bad_coordinates(engine, world_id, updates):
+    """A rejected move leaves the POI and the index untouched"""
+    poi = engine.create_poi(world_id, "town", 2, 2)
+    before = dict(poi)
+
+    with pytest.raises(ValueError):
+        engine.update_poi(world_id, poi["id"], dict(updates, name="Moved"))
+
+    assert poi == before
+    assert _near_ids(engine, world_id, 2, 2, 0) == [poi["id"]]
+
+
+def test_pois_near_after_world_deleted(engine, world_id):
+    """Deleting a world drops its POI index along with its POIs"""
+    world = engine.get_world(world_id)
+    poi = engine.create_poi(world_id, "town", 2, 2)
+    assert _near_ids(engine, world_id, 2, 2, 1) == [poi["id"]]
+
+    assert engine.delete_world(world_id)
+    assert engine.get_pois_near(world_id, 2, 2, 1) == []
+
+    # Reloading the world without its POIs must not revive the old index
+    engine.worlds[world_id] = dict(world, pois={})
+    assert engine.get_pois_near(world_id, 2, 2, 1) == []
+
+
+@pytest.mark.parametrize("offset, limit, expected", [
+    (0, 2, [0, 1]),
+    (3, 10, [3, 4]),
+    (5, 10, []),
+    (50, 10, []),
+    (-3, 2, [0, 1]),
+    (0, 0, []),
+    (0, -1, []),
+    (2, -5, [])
+], ids=["first", "partial", "at-end", "past-end", "negative-offset", "zero-limit", "negative-limit",
+        "offset-negative-limit"])
+def test_list_pois_page(engine, world_id, offset, limit, expected):
+    """Pages clamp to the POIs that exist and never go negative"""
+    pois = [engine.create_poi(world_id, "town", i, i) for i in range(5)]
+
+    page = engine.list_pois_page(world_id, offset=offset, limit=limit)
+
+    assert [poi["id"] for poi in page] == [pois[i]["id"] for i in expected]
+
+
+def test_list_pois_page_unknown_world(engine):
+    """An unknown world has an empty page"""
+    assert engine.list_pois_page("missing") == []
+
+
+def test_cached_terrain_is_copied(engine):
+    """Worlds from the same seed share no mutable terrain with the cache"""
+    first = engine.create_world(width=16, height=16, seed="11", island_mode=False)
+    pristine_vertices = list(first["mesh"]["vertices"])
+    pristine_height = float(first["heightmap"][0][0])
+
+    first["mesh"]["vertices"][0] = -1.0
+    first["mesh"]["biome_map"]["ocean"][0] = -1.0
+    first["heightmap"][0][0] = -1.0
+    second = engine.create_world(width=16, height=16, seed="11", island_mode=False)
+
+    assert len(engine._terrain_cache) == 1
+    assert second["mesh"] is not first["mesh"]
+    assert second["mesh"]["vertices"] == pristine_vertices
+    assert second["mesh"]["biome_map"]["ocean"][0] != -1.0
+    assert second["heightmap"][0][0] == pristine_height
+
+
+def test_delete_world_evicts_cached_terrain(engine, world_id):
+    """Deleting a world drops its terrain from the cache"""
+    assert len(engine._terrain_cache) == 1
+
+    assert engine.delete_world(world_id)
+
+    assert len(engine._terrain_cache) == 0
+    assert not engine.delete_world(world_id)